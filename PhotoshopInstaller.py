@@ -19,17 +19,26 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import collections
+import functools
+import importlib.util
+import io
 import os
 import sys
 import subprocess
 import shutil
-import threading
+import stat
 import json
 import re
+import secrets
+import select
+import shlex
+import signal
+import site
 import tempfile
-import urllib.request
 from pathlib import Path
 import time
+import types
 
 
 # ---------------------------------------------------------------------------
@@ -44,12 +53,69 @@ def get_base_dir():
     return os.path.dirname(os.path.abspath(__file__))
 
 
+VERSION_CONFIGS_PATH = os.path.join(get_base_dir(), "version_configs.json")
+
+
+@functools.lru_cache(maxsize=1)
+def read_version_configs(mtime, path):
+    """
+    Parsed version_configs.json; ``mtime`` is only the cache key (edits
+    invalidate). Read-only view, since the cached dict is shared.
+    """
+    with open(path, "r") as f:
+        return types.MappingProxyType(json.load(f))
+
+
+ICON_PATH = os.path.join(get_base_dir(), "pstux_icon.png")
+
+# command name → resolved path; only hits are cached (misses are re-probed so
+# a freshly installed tool is picked up) and each hit is re-checked with one stat
+_WHICH_CACHE = {}
+
+
+def _is_executable_file(path):
+    """Regular file with an execute bit set – one stat() instead of isfile + access."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+def _cached_which(name):
+    path = _WHICH_CACHE.get(name)
+    if path and _is_executable_file(path):
+        return path
+    _WHICH_CACHE.pop(name, None)
+    return None
+
+
+def which(name):
+    """shutil.which with a per-process cache of resolved commands."""
+    path = _cached_which(name)
+    if path is None:
+        path = shutil.which(name)
+        if path:
+            _WHICH_CACHE[name] = path
+    return path
+
+
+def find_executables(names):
+    """{name: path} for the given commands that are on $PATH."""
+    found = {}
+    for name in names:
+        path = which(name)
+        if path:
+            found[name] = path
+    return found
+
+
 def get_wine_binary():
     """Return path to the bundled Wine binary."""
     appdir = os.environ.get("APPDIR")
     if appdir:
         wine = os.path.join(appdir, "usr", "bin", "wine")
-        if os.path.isfile(wine) and os.access(wine, os.X_OK):
+        if _is_executable_file(wine):
             return wine
 
     # Fallback: development / non-AppImage
@@ -57,11 +123,11 @@ def get_wine_binary():
         os.path.dirname(os.path.abspath(__file__)),
         "wine-11.9-build", "wine"
     )
-    if os.path.isfile(dev_wine) and os.access(dev_wine, os.X_OK):
+    if _is_executable_file(dev_wine):
         return dev_wine
 
     # Last resort: system wine
-    system_wine = shutil.which("wine")
+    system_wine = which("wine")
     if system_wine:
         return system_wine
 
@@ -75,7 +141,7 @@ def get_wine_server():
         server = os.path.join(os.path.dirname(wine), "wineserver")
         if os.path.isfile(server):
             return server
-    return shutil.which("wineserver")
+    return which("wineserver")
 
 
 def wine_sync(env, timeout=120):
@@ -86,7 +152,8 @@ def wine_sync(env, timeout=120):
     try:
         subprocess.run(
             [wineserver, "-w"],
-            env=env, capture_output=True, timeout=timeout,
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=timeout,
         )
     except (subprocess.TimeoutExpired, OSError):
         pass
@@ -107,6 +174,31 @@ CAMERA_RAW_INSTALLER_URL = (
     "CameraRaw_12_2_1.exe"
 )
 
+# Stability fixes (apply_ps_fixes): Photoshop.exe DLL overrides and the
+# per-version registry keys whose Home Screen gets disabled.
+PHOTOSHOP_DLL_OVERRIDES = (
+    ("atmlib", "native"),
+    ("gdiplus", "builtin,native"),
+    ("riched20", "builtin,native"),
+)
+PHOTOSHOP_REG_VERSIONS = ("150.0", "160.0", "170.0", "180.0")
+# Adobe background services forced to Windows 7 mode (crash in newer modes)
+ADOBE_WIN7_SERVICES = (
+    "Creative Cloud.exe",
+    "Creative Cloud Helper.exe",
+    "Creative Cloud UI Helper.exe",
+    "CCXProcess.exe",
+    "AdobeIPCBroker.exe",
+    "Adobe Crash Processor.exe",
+    "node.exe",
+)
+# Adobe login/licensing caches removed by Deep Repair (relative to the prefix)
+ADOBE_CACHE_SUBPATHS = (
+    "drive_c/users/{user}/AppData/Local/Adobe/OOBE",
+    "drive_c/Program Files (x86)/Common Files/Adobe/SLCache",
+    "drive_c/ProgramData/Adobe/SLStore",
+)
+
 PSD_MIME_TYPES = "image/psd;image/x-psd;image/vnd.adobe.photoshop;"
 PHOTOSHOP_STARTUP_WM_CLASS = "photoshop.exe"
 
@@ -169,6 +261,54 @@ def format_photoshop_launch_exec(include_file_arg=True):
     return base
 
 
+def write_desktop_file(path, content):
+    """Write a .desktop file with a single write(), mode 0644."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # The open() mode only applies to new files (and is umasked)
+        os.fchmod(fd, 0o644)
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _copy_file_range(src, dst):
+    """Copy with os.copy_file_range; False if unsupported or short."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if n == 0:
+                    return False
+                remaining -= n
+        return True
+    except OSError:
+        return False
+
+
+def copy_file_in_kernel(src, dst):
+    """
+    Copy *src* over *dst* with copy_file_range (shutil.copyfile as fallback).
+    The data goes to a temp file that replaces *dst*, so an existing *dst*
+    that is a hardlink to some other file is never written through.
+    """
+    tmp = f"{dst}.tmp.{os.getpid()}"
+    try:
+        # Short copy (size changed) or unsupported filesystem pair, e.g. squashfs
+        if not _copy_file_range(src, tmp):
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def build_photoshop_desktop_entry(exec_line, icon_path):
     """Freedesktop entry with PSD association and correct taskbar grouping."""
     return (
@@ -195,7 +335,7 @@ def winepath_to_windows(wine, env, unix_path):
     try:
         result = subprocess.run(
             [wine, "winepath", "-w", path],
-            env=env,
+            env=quiet_wine_env(env),
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -211,26 +351,54 @@ def winepath_to_windows(wine, env, unix_path):
     return None
 
 
+def winepaths_to_windows(wine, env, unix_paths):
+    """
+    Convert several Linux paths with one ``winepath`` call (one wine start
+    instead of one per file). Missing files are dropped; order is kept.
+    """
+    paths = [
+        p for p in (os.path.abspath(os.path.expanduser(u)) for u in unix_paths if u)
+        if os.path.exists(p)
+    ]
+    if len(paths) < 2:
+        return [w for w in (winepath_to_windows(wine, env, p) for p in paths) if w]
+    try:
+        result = subprocess.run(
+            [wine, "winepath", "-w", *paths],
+            env=quiet_wine_env(env),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=20,
+        )
+        lines = result.stdout.splitlines()
+        # winepath prints one line per argument (empty on failure)
+        if result.returncode == 0 and len(lines) == len(paths):
+            return [w.strip() for w in lines if w.strip()]
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+    return [w for w in (winepath_to_windows(wine, env, p) for p in paths) if w]
+
+
 def build_photoshop_launch_command(wine, ps_exe, env, file_paths=None):
     """argv for wine Photoshop.exe [optional document paths in Windows form]."""
     cmd = [wine, ps_exe]
     if file_paths:
-        for unix_path in file_paths:
-            win_path = winepath_to_windows(wine, env, unix_path)
-            if win_path:
-                cmd.append(win_path)
+        cmd.extend(winepaths_to_windows(wine, env, file_paths))
     return cmd
 
 
 def launch_photoshop_process(wine, ps_exe, env=None, file_paths=None):
     """Start Photoshop (optionally opening one or more files)."""
-    env = env or make_wine_env()
+    env = quiet_wine_env(env or make_wine_env())
     cmd = build_photoshop_launch_command(wine, ps_exe, env, file_paths)
     subprocess.Popen(
         cmd,
         env=env,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
+        start_new_session=True,
     )
 
 
@@ -238,20 +406,20 @@ def register_psd_file_association(app_dir):
     """Register photoshop-app.desktop as default handler for PSD MIME types (best effort)."""
     desktop_id = "photoshop-app.desktop"
     for mime in ("image/psd", "image/x-psd", "image/vnd.adobe.photoshop"):
-        if shutil.which("xdg-mime"):
+        if which("xdg-mime"):
             try:
                 subprocess.run(
                     ["xdg-mime", "default", desktop_id, mime],
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                     timeout=10,
                 )
             except (subprocess.TimeoutExpired, OSError):
                 pass
-    if shutil.which("update-desktop-database"):
+    if which("update-desktop-database"):
         try:
             subprocess.run(
                 ["update-desktop-database", str(app_dir)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                 timeout=15,
             )
         except (subprocess.TimeoutExpired, OSError):
@@ -273,30 +441,45 @@ def collect_launch_file_args(argv=None):
     return files
 
 
-def make_wine_env():
-    """Wine environment for subprocess / Popen (bundled DLLs + dxvk.conf)."""
+@functools.lru_cache(maxsize=None)
+def _bundled_wine_dll_path(appdir):
+    """':'-joined Wine DLL dirs inside an AppImage mount (fixed per mount)."""
+    dll_dirs = [
+        os.path.join(appdir, "usr", "lib64", "wine", "x86_64-unix"),
+        os.path.join(appdir, "usr", "lib", "wine", "x86_64-unix"),
+        os.path.join(appdir, "usr", "lib64", "wine", "i386-unix"),
+        os.path.join(appdir, "usr", "lib", "wine", "i386-unix"),
+        os.path.join(appdir, "usr", "lib64", "wine"),
+        os.path.join(appdir, "usr", "lib", "wine"),
+    ]
+    return ":".join(filter(os.path.isdir, dll_dirs))
+
+
+@functools.lru_cache(maxsize=None)
+def _wineserver_for(wine):
+    wineserver = os.path.join(os.path.dirname(wine), "wineserver")
+    return wineserver if os.path.isfile(wineserver) else None
+
+
+def make_wine_env(prefix=None, wine=None):
+    """
+    Wine environment for subprocess / Popen / QProcess (bundled DLLs +
+    dxvk.conf). Shared by all handlers and worker threads.
+    """
     env = os.environ.copy()
-    prefix = get_prefix_path()
+    prefix = prefix or get_prefix_path()
     env["WINEPREFIX"] = prefix
-    wine = get_wine_binary()
+    wine = wine or get_wine_binary()
     if wine:
         env["WINE"] = wine
-        wine_dir = os.path.dirname(wine)
-        wineserver = os.path.join(wine_dir, "wineserver")
-        if os.path.isfile(wineserver):
+        wineserver = _wineserver_for(wine)
+        if wineserver:
             env["WINESERVER"] = wineserver
 
+    # Point to bundled Wine libs if inside AppImage (64-bit + 32-bit WoW64)
     appdir = os.environ.get("APPDIR")
     if appdir:
-        dll_dirs = [
-            os.path.join(appdir, "usr", "lib64", "wine", "x86_64-unix"),
-            os.path.join(appdir, "usr", "lib", "wine", "x86_64-unix"),
-            os.path.join(appdir, "usr", "lib64", "wine", "i386-unix"),
-            os.path.join(appdir, "usr", "lib", "wine", "i386-unix"),
-            os.path.join(appdir, "usr", "lib64", "wine"),
-            os.path.join(appdir, "usr", "lib", "wine"),
-        ]
-        extra = ":".join(d for d in dll_dirs if os.path.isdir(d))
+        extra = _bundled_wine_dll_path(appdir)
         if extra:
             env["WINEDLLPATH"] = extra + ":" + env.get("WINEDLLPATH", "")
 
@@ -311,6 +494,13 @@ def make_wine_env():
     return env
 
 
+def quiet_wine_env(env):
+    """*env* with Wine debug channels off, unless the user set WINEDEBUG."""
+    if "WINEDEBUG" in env:
+        return env
+    return {**env, "WINEDEBUG": "-all"}
+
+
 def _adobe_program_roots(prefix):
     """Program Files locations where Adobe may install Photoshop."""
     drive = prefix / "drive_c"
@@ -335,12 +525,29 @@ def find_photoshop_install_dirs(prefix_path=None):
     return sorted(dirs, key=lambda p: p.name, reverse=True)
 
 
+# prefix → located Photoshop.exe; a hit is re-validated with one stat, so a
+# deleted install is noticed. Cleared when an installer run finishes.
+_PS_EXE_CACHE = {}
+
+
 def find_photoshop_exe(prefix_path=None):
     """
     Locate Photoshop.exe in the Wine prefix.
     Checks Program Files, Program Files (x86), and falls back to drive_c search.
     """
-    prefix = Path(prefix_path or get_prefix_path())
+    key = os.fspath(prefix_path or get_prefix_path())
+    cached = _PS_EXE_CACHE.get(key)
+    if cached and os.path.isfile(cached):
+        return cached
+    exe = _scan_photoshop_exe(Path(key))
+    if exe:
+        _PS_EXE_CACHE[key] = exe
+    else:
+        _PS_EXE_CACHE.pop(key, None)
+    return exe
+
+
+def _scan_photoshop_exe(prefix):
     candidates = []
 
     for ps_dir in find_photoshop_install_dirs(prefix):
@@ -391,6 +598,187 @@ def remove_start_menu_entries():
     return removed
 
 
+def remove_trees(paths, background=False):
+    """
+    Delete directory trees with native ``rm -rf`` (shutil.rmtree fallback),
+    one process per tree so independent trees are removed in parallel.
+    With background=True the rm processes run detached in their own session
+    and this returns immediately.
+    """
+    paths = [os.fspath(p) for p in paths]
+    if not paths:
+        return
+    rm = which("rm")
+    if rm:
+        try:
+            procs = [
+                subprocess.Popen(
+                    [rm, "-rf", "--", p],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    start_new_session=background,
+                )
+                for p in paths
+            ]
+        except OSError:
+            procs = None
+        if procs is not None:
+            if not background:
+                for proc in procs:
+                    proc.wait()
+            return
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        list(pool.map(lambda p: shutil.rmtree(p, ignore_errors=True), paths))
+
+
+def kill_all_wine_processes():
+    """Forcefully kill ALL Wine-related processes and clean up locks."""
+    killed = []
+
+    # Step 1: graceful wineserver shutdown
+    wineserver = get_wine_server()
+    if wineserver:
+        try:
+            subprocess.run(
+                [wineserver, "-k"], timeout=5,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            killed.append("wineserver (graceful)")
+        except Exception:
+            pass
+
+    # Step 2: forcefully kill wineserver if still running
+    if wineserver:
+        try:
+            subprocess.run(
+                [wineserver, "-k9"], timeout=5,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            pass
+
+    # Step 3: kill all Wine-related processes by name
+    wine_procs = [
+        "wine", "wine64", "wine-preloader", "wine64-preloader",
+        "wineserver", "wineboot", "winedbg", "winetricks",
+        "msiexec.exe", "services.exe", "plugplay.exe",
+        "svchost.exe", "rpcss.exe", "explorer.exe",
+    ]
+    for proc_name in wine_procs:
+        try:
+            result = subprocess.run(
+                ["pkill", "-9", "-f", proc_name],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3,
+            )
+            if result.returncode == 0:
+                killed.append(proc_name)
+        except Exception:
+            pass
+
+    # Step 4: clean lock files from the prefix
+    prefix = Path(get_prefix_path())
+    locks_cleaned = 0
+    if prefix.exists():
+        # Remove .lck files
+        for lck in prefix.rglob("*.lck"):
+            try:
+                lck.unlink()
+                locks_cleaned += 1
+            except Exception:
+                pass
+        # Remove wineserver socket directory
+        server_dir = prefix / ".wineserver"
+        if server_dir.exists():
+            shutil.rmtree(server_dir, ignore_errors=True)
+            locks_cleaned += 1
+        # Remove /tmp wineserver sockets for this prefix
+        try:
+            with os.scandir("/tmp") as it:
+                for entry in it:
+                    if (entry.name.startswith(".wine-")
+                            and entry.is_dir(follow_symlinks=False)):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                        locks_cleaned += 1
+        except Exception:
+            pass
+
+    return killed, locks_cleaned
+
+
+def _trash_prefix(path):
+    return f".{path.name.lstrip('.')}.trash."
+
+
+def _tree_fanout(root):
+    """
+    Independent subtrees of ``root`` for parallel deletion: its entries, with
+    drive_c (where nearly all of a Wine prefix lives) expanded one level.
+    """
+    parts = []
+    try:
+        with os.scandir(root) as it:
+            for e in it:
+                if e.name == "drive_c" and e.is_dir(follow_symlinks=False):
+                    try:
+                        with os.scandir(e.path) as sub:
+                            parts.extend(s.path for s in sub)
+                        continue
+                    except OSError:
+                        pass
+                parts.append(e.path)
+    except OSError:
+        pass
+    return parts
+
+
+# Detached worker for discard_tree: one rm per subtree, then the empty skeleton
+_FANOUT_RM_SCRIPT = 'root=$1; shift; for p in "$@"; do rm -rf -- "$p" & done; wait; rm -rf -- "$root"'
+
+
+def discard_tree(path):
+    """
+    Rename ``path`` to a hidden sibling and delete that in the background, so
+    the original location is free immediately. Falls back to a synchronous
+    delete when the rename is not possible (e.g. EXDEV on a mount point).
+    Subtrees are removed by parallel rm processes.
+    """
+    path = Path(path)
+    trash = path.with_name(f"{_trash_prefix(path)}{os.getpid()}.{secrets.token_hex(4)}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        remove_trees(_tree_fanout(path))
+        remove_trees([path])
+        return
+    parts = _tree_fanout(trash)
+    sh = which("sh")
+    if sh and parts:
+        try:
+            subprocess.Popen(
+                [sh, "-c", _FANOUT_RM_SCRIPT, "sh", os.fspath(trash), *parts],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            return
+        except OSError:
+            pass
+    remove_trees([trash], background=True)
+
+
+def sweep_discarded_trees(path):
+    """Background-delete leftovers of earlier discard_tree(path) calls."""
+    path = Path(path)
+    tag = _trash_prefix(path)
+    try:
+        with os.scandir(path.parent) as it:
+            leftovers = [
+                e.path for e in it
+                if e.name.startswith(tag) and e.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return
+    remove_trees(leftovers, background=True)
+
+
 def uninstall_photoshop_from_prefix(prefix_path=None):
     """
     Remove Photoshop install folders from the prefix and start menu entries.
@@ -398,6 +786,7 @@ def uninstall_photoshop_from_prefix(prefix_path=None):
     """
     prefix = Path(prefix_path or get_prefix_path())
     removed_dirs = []
+    _PS_EXE_CACHE.clear()
     for ps_dir in find_photoshop_install_dirs(prefix):
         shutil.rmtree(ps_dir, ignore_errors=False)
         removed_dirs.append(str(ps_dir))
@@ -507,25 +896,148 @@ def apply_adobe_runtime_fixes(prefix_path=None):
 
 def apply_cc_network_registry(prefix_path=None):
     """NLA ActiveDnsProbeHost tweak for Creative Cloud network detection."""
+    key = r"SYSTEM\CurrentControlSet\Services\NlaSvc\Parameters\Internet"
+    # CurrentControlSet is only a registry link; system.reg stores the values
+    # under ControlSet001
+    current = read_user_reg_key(
+        prefix_path,
+        r"System\ControlSet001\Services\NlaSvc\Parameters\Internet",
+        hive="system.reg",
+    )
+    if current.get("activednsprobehost") == "www.adobe.com":
+        # Already set: no wine start on every launch
+        return True
     wine = get_wine_binary()
     if not wine:
         return False
-    env = make_wine_env()
+    env = make_wine_env(str(prefix_path) if prefix_path else None)
     wine_sync(env, timeout=30)
     try:
         result = subprocess.run(
             [
-                wine, "reg", "add",
-                r"HKLM\SYSTEM\CurrentControlSet\Services\NlaSvc\Parameters\Internet",
+                wine, "reg", "add", "HKLM\\" + key,
                 "/v", "ActiveDnsProbeHost", "/t", "REG_SZ", "/d", "www.adobe.com", "/f",
             ],
-            env=env, capture_output=True, timeout=30,
+            env=quiet_wine_env(env),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30,
         )
         return result.returncode == 0
     except (subprocess.TimeoutExpired, OSError):
         return False
 
 
+_USER_REG_VALUE_RE = re.compile(r'^"((?:[^"\\]|\\.)*)"=(.*)$')
+
+
+def _unescape_reg_string(s):
+    return re.sub(r"\\(.)", r"\1", s)
+
+
+def _parse_reg_data(raw):
+    """user.reg value → str (REG_SZ), int (dword) or the raw text for other types."""
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] == '"' and raw[-1] == '"':
+        return _unescape_reg_string(raw[1:-1])
+    if raw.startswith("dword:"):
+        try:
+            return int(raw[6:], 16)
+        except ValueError:
+            pass
+    return raw
+
+
+def read_user_reg_key(prefix_path, key, hive="user.reg"):
+    """
+    Read the values of an HKCU key straight from ``user.reg`` (no wine spawn);
+    ``hive="system.reg"`` reads an HKLM key the same way.
+    Returns {lowercased value name: value}; empty if the key or file is missing.
+    """
+    reg_file = Path(prefix_path or get_prefix_path()) / hive
+    header = "[" + key.replace("\\", "\\\\").lower() + "]"
+    values = {}
+    try:
+        with open(reg_file, "r", encoding="utf-8", errors="replace") as f:
+            in_key = False
+            for line in f:
+                if line.startswith("["):
+                    if in_key:
+                        break
+                    in_key = line.lower().startswith(header)
+                    continue
+                if not in_key:
+                    continue
+                m = _USER_REG_VALUE_RE.match(line.rstrip("\n"))
+                if m:
+                    name = _unescape_reg_string(m.group(1)).lower()
+                    values[name] = _parse_reg_data(m.group(2))
+    except OSError:
+        pass
+    return values
+
+
+def pending_user_reg_values(prefix_path, wanted):
+    """
+    Filter (key, name, value) HKCU entries down to those not already set.
+    ``value`` is a str (REG_SZ) or int (REG_DWORD).
+    """
+    cache = {}
+    pending = []
+    for key, name, value in wanted:
+        if key not in cache:
+            cache[key] = read_user_reg_key(prefix_path, key)
+        if cache[key].get(name.lower()) != value:
+            pending.append((key, name, value))
+    return pending
+
+
+def _reg_escape(s):
+    return s.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def build_reg_file(entries):
+    """
+    (key, name, value) HKCU entries → .reg file text for ``wine regedit``.
+    Consecutive entries with the same key share one section.
+    """
+    buf = io.StringIO()
+    buf.write("Windows Registry Editor Version 5.00\r\n")
+    current = None
+    for key, name, value in entries:
+        if key != current:
+            buf.write(f"\r\n[HKEY_CURRENT_USER\\{key}]\r\n")
+            current = key
+        if isinstance(value, int):
+            data = f"dword:{value:08x}"
+        else:
+            data = f'"{_reg_escape(value)}"'
+        buf.write(f'"{_reg_escape(name)}"={data}\r\n')
+    return buf.getvalue()
+
+
+def import_reg_file(wine, env, reg_text, timeout=60):
+    """
+    Import .reg text with a single ``wine regedit /S`` (one wine startup for
+    any number of values). Returns the CompletedProcess; may raise TimeoutExpired.
+    """
+    reg_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".reg", delete=False, encoding="utf-8"
+        ) as f:
+            f.write(reg_text)
+            reg_path = f.name
+        return subprocess.run(
+            [wine, "regedit", "/S", reg_path],
+            env=env, capture_output=True, text=True, timeout=timeout,
+        )
+    finally:
+        if reg_path:
+            try:
+                os.unlink(reg_path)
+            except OSError:
+                pass
+
+
 def analyze_wine_log(text):
     """Return list of hint strings matching known error patterns."""
     if not text:
@@ -539,6 +1051,31 @@ def analyze_wine_log(text):
     return hints
 
 
+class WineLogScanner:
+    """
+    analyze_wine_log for text that arrives line by line: feed() each line,
+    then hints(). Every WINE_LOG_HINTS pattern matches within a single line.
+    """
+
+    def __init__(self):
+        self._remaining = list(WINE_LOG_HINTS)
+        self._matched = set()
+
+    def feed(self, line):
+        if not self._remaining:
+            return
+        for entry in [e for e in self._remaining if e[0].search(line)]:
+            self._remaining.remove(entry)
+            self._matched.add(entry[1])
+
+    def hints(self):
+        hints = []
+        for _, message in WINE_LOG_HINTS:
+            if message in self._matched and message not in hints:
+                hints.append(message)
+        return hints
+
+
 def format_adobe_runtime_fixes_report(report):
     """Human-readable status from apply_adobe_runtime_fixes()."""
     lines = ["<b>Adobe runtime fixes status</b>"]
@@ -578,8 +1115,9 @@ def format_adobe_runtime_fixes_report(report):
     return "<br>".join(lines)
 
 
+@functools.lru_cache(maxsize=1)
 def get_prefix_path():
-    """Return the Wine prefix path."""
+    """Return the Wine prefix path (resolved once; $HOME doesn't change at runtime)."""
     return str(Path.home() / ".photoshop_cc")
 
 
@@ -632,31 +1170,148 @@ def wine_supports_32bit(wine_path):
     return any(os.path.isdir(p) for p in candidates)
 
 
+# os-release ID → package-management family
+_DISTRO_FAMILIES = {
+    **dict.fromkeys(
+        ("ubuntu", "debian", "pop", "mint", "kali", "elementary", "zorin"), "debian"
+    ),
+    **dict.fromkeys(("arch", "manjaro", "cachyos", "endeavouros", "garuda"), "arch"),
+    **dict.fromkeys(
+        ("fedora", "nobara", "redhat", "rhel", "centos", "rocky", "alma"), "fedora"
+    ),
+    **dict.fromkeys(
+        ("opensuse", "opensuse-leap", "opensuse-tumbleweed", "suse"), "suse"
+    ),
+}
+
+
+def _os_release_value(raw):
+    """Unquote an os-release value (shell-style quoting, per os-release(5))."""
+    try:
+        return " ".join(shlex.split(raw, comments=False))
+    except ValueError:
+        return raw.strip().strip("\"'")
+
+
+@functools.lru_cache(maxsize=1)
 def detect_distro():
-    """Detect Linux distribution family for package management."""
+    """Detect Linux distribution family for package management (cached)."""
     try:
-        if os.path.exists("/etc/os-release"):
-            info = {}
-            with open("/etc/os-release", "r") as f:
-                for line in f:
-                    if "=" in line:
-                        k, v = line.strip().split("=", 1)
-                        info[k] = v.strip('"')
-            distro = info.get("ID", "unknown").lower()
-            id_like = info.get("ID_LIKE", "").lower()
-
-            if distro in ("ubuntu", "debian", "pop", "mint", "kali", "elementary", "zorin") or "debian" in id_like:
-                return "debian"
-            if distro in ("arch", "manjaro", "cachyos", "endeavouros", "garuda") or "arch" in id_like:
-                return "arch"
-            if distro in ("fedora", "nobara", "redhat", "centos", "rocky", "alma") or "fedora" in id_like:
-                return "fedora"
-            if distro in ("opensuse", "opensuse-leap", "opensuse-tumbleweed", "suse") or "suse" in id_like:
-                return "suse"
-            return distro
-    except Exception:
-        pass
-    return "unknown"
+        with open("/etc/os-release", "rb") as f:
+            text = f.read().decode("utf-8", errors="replace")
+    except OSError:
+        return "unknown"
+
+    info = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        k, sep, v = line.partition("=")
+        if sep:
+            info[k.strip()] = _os_release_value(v)
+    distro = info.get("ID", "unknown").lower()
+
+    family = _DISTRO_FAMILIES.get(distro)
+    if family:
+        return family
+    # ID_LIKE is a space-separated list, closest relative first
+    for like in info.get("ID_LIKE", "").lower().split():
+        family = _DISTRO_FAMILIES.get(like)
+        if family:
+            return family
+    return distro
+
+
+# Runtime packages per distro family and the argv templates that install
+# them ("{pkgs}" expands to the package list); commands run in order, all
+# inside one privileged shell.
+RUNTIME_PACKAGES = {
+    "debian": ("winetricks", "libxcb-cursor0"),
+    "arch": ("winetricks",),
+    "fedora": ("winetricks",),
+    "suse": ("winetricks",),
+}
+PACKAGE_INSTALL_COMMANDS = {
+    "debian": (
+        ("apt-get", "update"),
+        ("apt-get", "install", "-y", "--no-install-recommends", "{pkgs}"),
+    ),
+    "arch": (("pacman", "-S", "--noconfirm", "{pkgs}"),),
+    "fedora": (("dnf", "install", "-y", "{pkgs}"),),
+    "suse": (("zypper", "install", "-y", "{pkgs}"),),
+}
+# One unprivileged query per family; an output line starting with a package
+# name marks it installed (for dpkg only when the status field says so).
+PACKAGE_QUERY_COMMANDS = {
+    "debian": ("dpkg-query", "-W", "-f=${Package} ${db:Status-Status}\n", "{pkgs}"),
+    "arch": ("pacman", "-Q", "{pkgs}"),
+    "fedora": ("rpm", "-q", "--qf", "%{NAME}\n", "{pkgs}"),
+    "suse": ("rpm", "-q", "--qf", "%{NAME}\n", "{pkgs}"),
+}
+
+
+def _expand_template(template, pkgs):
+    return tuple(
+        arg for token in template for arg in (pkgs if token == "{pkgs}" else (token,))
+    )
+
+
+def _expand_install_commands(distro, pkgs=None):
+    pkgs = pkgs or RUNTIME_PACKAGES[distro]
+    return tuple(
+        _expand_template(template, pkgs) for template in PACKAGE_INSTALL_COMMANDS[distro]
+    )
+
+
+# Expanded once at import; install_missing_deps is then a dict lookup
+_PKG_MAP = {distro: _expand_install_commands(distro) for distro in PACKAGE_INSTALL_COMMANDS}
+# Each full chain as one shell script (privileged sh -c and the log line)
+_PKG_MAP_TEXT = {
+    distro: " && ".join(shlex.join(cmd) for cmd in cmds) for distro, cmds in _PKG_MAP.items()
+}
+
+
+def package_query_command(distro):
+    """argv listing which runtime packages are installed; None if unsupported."""
+    template = PACKAGE_QUERY_COMMANDS.get(distro)
+    if not template or not which(template[0]):
+        return None
+    return list(_expand_template(template, RUNTIME_PACKAGES[distro]))
+
+
+def missing_runtime_packages(distro, query_lines):
+    """Runtime packages of ``distro`` not reported installed by its query output."""
+    installed = set()
+    for line in query_lines:
+        fields = line.split()
+        if fields and (distro != "debian" or fields[1:] == ["installed"]):
+            installed.add(fields[0])
+    return [p for p in RUNTIME_PACKAGES[distro] if p not in installed]
+
+
+def package_install_script(distro, pkgs=None):
+    """Shell text of the install chain; precomputed for the full package list."""
+    if not pkgs or tuple(pkgs) == RUNTIME_PACKAGES[distro]:
+        return _PKG_MAP_TEXT[distro]
+    cmds = _expand_install_commands(distro, tuple(pkgs))
+    return " && ".join(shlex.join(cmd) for cmd in cmds)
+
+
+def package_install_commands(distro, pkgs=None):
+    """
+    argv lists installing the runtime packages (or just ``pkgs``) on ``distro``;
+    None if unsupported. The whole chain runs under a single pkexec (sudo
+    without polkit), so the user authenticates once.
+    """
+    cmds = _PKG_MAP.get(distro)
+    if not cmds:
+        return None
+    if pkgs and tuple(pkgs) != RUNTIME_PACKAGES[distro]:
+        cmds = _expand_install_commands(distro, tuple(pkgs))
+    elevate = "pkexec" if which("pkexec") else "sudo"
+    if len(cmds) == 1:
+        return [[elevate, *cmds[0]]]
+    return [[elevate, "sh", "-c", package_install_script(distro, pkgs)]]
 
 
 def detect_gpus():
@@ -686,17 +1341,65 @@ def detect_gpus():
     return gpus
 
 
+# ---------------------------------------------------------------------------
+# Direct launch mode (--launch)
+# ---------------------------------------------------------------------------
+
+def direct_launch():
+    """Launch Photoshop without showing the GUI (optional files after --launch)."""
+    wine = get_wine_binary()
+    if not wine:
+        print("ERROR: Wine binary not found.")
+        sys.exit(1)
+
+    prefix = Path(get_prefix_path())
+    ps = find_photoshop_exe(prefix)
+    if not ps:
+        print("ERROR: Photoshop.exe not found in prefix.")
+        print(f"Prefix: {prefix}")
+        sys.exit(1)
+
+    file_paths = collect_launch_file_args()
+    env = quiet_wine_env(make_wine_env())
+    if file_paths:
+        print(f"Launching: {ps} with {len(file_paths)} file(s)")
+    else:
+        print(f"Launching: {ps}")
+    apply_adobe_runtime_fixes(prefix)
+    cmd = build_photoshop_launch_command(wine, ps, env, file_paths or None)
+    # exec discards Python's buffers; flush so the lines above reach a pipe/journal
+    sys.stdout.flush()
+    os.execvpe(cmd[0], cmd, env)
+
+
+# --launch only needs the helpers above: hand over to Wine before PyQt6 is
+# imported (or pip-installed) at all.
+if __name__ == "__main__" and "--launch" in sys.argv:
+    direct_launch()
+    sys.exit(0)
+
+# GUI-only modules, kept off the --launch path (~90 ms of imports together)
+import urllib.request  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+
+
 # ---------------------------------------------------------------------------
 # Attempt to import / install PyQt6
 # ---------------------------------------------------------------------------
 
+def _pyqt6_available():
+    # Only locate QtWidgets (importing the PyQt6 package, not Qt itself); the
+    # real import below is the one that loads the Qt libraries
+    try:
+        return importlib.util.find_spec("PyQt6.QtWidgets") is not None
+    except ImportError:
+        return False
+
+
 def ensure_pyqt6():
     """Make sure PyQt6 is importable. Return True on success."""
-    try:
-        import PyQt6.QtWidgets  # noqa: F401
+    if _pyqt6_available():
         return True
-    except ImportError:
-        pass
 
     # Running inside AppImage → should always be bundled
     if os.environ.get("APPDIR"):
@@ -707,10 +1410,15 @@ def ensure_pyqt6():
     print("PyQt6 not found, attempting pip install...")
     try:
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "--user", "PyQt6"],
+            [sys.executable, "-m", "pip", "install", "--user",
+             "--no-input", "--disable-pip-version-check",
+             "--no-warn-script-location", "--only-binary=:all:", "PyQt6"],
             stdout=subprocess.DEVNULL
         )
-        return True
+        # A fresh ~/.local site-packages isn't on sys.path until added
+        site.addsitedir(site.getusersitepackages())
+        importlib.invalidate_caches()
+        return _pyqt6_available()
     except Exception as e:
         print(f"Failed to install PyQt6: {e}")
         print("Please install manually:")
@@ -729,29 +1437,103 @@ from PyQt6.QtWidgets import (
     QTextEdit, QGroupBox, QFileDialog, QLineEdit, QMessageBox, QMenu,
     QSlider, QDialog, QDialogButtonBox, QRadioButton, QButtonGroup,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
-from PyQt6.QtGui import QIcon, QPixmap, QDesktopServices
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QUrl, QProcess, QProcessEnvironment,
+    QObject, QRunnable, QThreadPool,
+)
+from PyQt6.QtGui import (
+    QIcon, QPixmap, QDesktopServices, QTextCursor, QTextCharFormat, QColor,
+    QImageReader,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def app_icon(size=None):
+    """Decode the app icon once per size; None if missing or unreadable.
+
+    With *size*, QImageReader decodes and scales into that square (aspect
+    kept) in one pass; the result is cached like the full-size pixmap.
+    """
+    reader = QImageReader(ICON_PATH)
+    if not reader.canRead():
+        return None
+    if size is not None:
+        full = reader.size()
+        if full.isValid():
+            reader.setScaledSize(
+                full.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+    image = reader.read()
+    return None if image.isNull() else QPixmap.fromImage(image)
 
 
 # ---------------------------------------------------------------------------
 # Worker threads
+#
+# Long-running child processes are awaited with a plain blocking wait inside
+# a QThread (subprocess.run → waitpid) or through QProcess.finished on the GUI
+# thread. Never poll Popen.poll() / Thread.is_alive() from a QTimer.
 # ---------------------------------------------------------------------------
 
-class DependencyChecker(QThread):
-    """Check for required runtime dependencies (not build deps anymore)."""
+class DependencySignals(QObject):
+    """Signals for DependencyChecker (QRunnable cannot emit by itself)."""
     status_signal = pyqtSignal(dict)
 
+
+class DependencyChecker(QRunnable):
+    """Check for required runtime dependencies (not build deps anymore)."""
+
+    # Commands looked up on $PATH: label → executable name
+    PATH_DEPS = {"winetricks": "winetricks"}
+
+    def __init__(self):
+        super().__init__()
+        self.signals = DependencySignals()
+
     def run(self):
-        deps = {
-            "wine (bundled)": get_wine_binary() is not None,
-            "winetricks": shutil.which("winetricks") is not None,
-        }
-        self.status_signal.emit(deps)
+        found = find_executables(self.PATH_DEPS.values())
+        deps = {"wine (bundled)": get_wine_binary() is not None}
+        for label, cmd in self.PATH_DEPS.items():
+            deps[label] = cmd in found
+        # Warm the distro cache here so "Install System Packages" reads no file
+        detect_distro()
+        self.signals.status_signal.emit(deps)
+
+
+class LogBatcher:
+    """
+    Coalesce worker-thread log lines into one list emit per ``interval``
+    seconds (≤20 Hz), so bursts don't cross the thread boundary line by line.
+    Call flush() before blocking waits and before the finished signal.
+    """
+
+    def __init__(self, emit, interval=0.05):
+        self._emit = emit
+        self._interval = interval
+        self._buf = []
+        self._last = 0.0
+
+    def add(self, msg):
+        self._buf.append(msg)
+        if time.monotonic() - self._last >= self._interval:
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            batch, self._buf = self._buf, []
+            self._emit(batch)
+        self._last = time.monotonic()
+
+
+# Progress marker winetricks prints when it starts a verb
+_WINETRICKS_VERB_RE = re.compile(rb"Executing[^\n]*w_do_call[ \t]+(\S+)")
+# Time limit per winetricks verb; a batch gets this times its verb count
+WINETRICKS_VERB_TIMEOUT = 300
 
 
 class WineSetupThread(QThread):
     """Initialize Wine prefix and install winetricks components."""
-    log_signal = pyqtSignal(str)
+    log_batch_signal = pyqtSignal(list)
     progress_signal = pyqtSignal(int)
     finished_signal = pyqtSignal(bool)
 
@@ -760,143 +1542,245 @@ class WineSetupThread(QThread):
         self.prefix_path = prefix_path
         self.wine_path = wine_path
         self.components = components
-
-    def _make_env(self):
-        env = os.environ.copy()
-        env["WINEPREFIX"] = self.prefix_path
-        env["WINE"] = self.wine_path
-
-        wine_dir = os.path.dirname(self.wine_path)
-        wineserver = os.path.join(wine_dir, "wineserver")
-        if os.path.isfile(wineserver):
-            env["WINESERVER"] = wineserver
-
-        # Point to bundled Wine libs if inside AppImage (64-bit + 32-bit WoW64)
-        appdir = os.environ.get("APPDIR")
-        if appdir:
-            dll_dirs = [
-                os.path.join(appdir, "usr", "lib64", "wine", "x86_64-unix"),
-                os.path.join(appdir, "usr", "lib", "wine", "x86_64-unix"),
-                os.path.join(appdir, "usr", "lib64", "wine", "i386-unix"),
-                os.path.join(appdir, "usr", "lib", "wine", "i386-unix"),
-                os.path.join(appdir, "usr", "lib64", "wine"),
-                os.path.join(appdir, "usr", "lib", "wine"),
-            ]
-            extra = ":".join(filter(os.path.isdir, dll_dirs))
-            if extra:
-                env["WINEDLLPATH"] = extra + ":" + env.get("WINEDLLPATH", "")
-
-        return env
+        self._log = LogBatcher(self.log_batch_signal.emit)
+
+    def _winetricks_batch(self, verbs, env, done):
+        """
+        One ``winetricks -q`` call for ``verbs``; progress from its output.
+        Returns the exit code, or None if the batch timed out and was killed.
+        """
+        total = len(self.components)
+        wanted = set(verbs)
+        proc = subprocess.Popen(
+            ["winetricks", "-q", *verbs],
+            env=quiet_wine_env(env), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + WINETRICKS_VERB_TIMEOUT * len(verbs)
+        # Scan the output in 64 KiB chunks instead of line by line; only
+        # complete lines are matched, the remainder carries over.
+        fd = proc.stdout.fileno()
+        tail = b""
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0 or not select.select([fd], [], [], left)[0]:
+                # Hung verb: kill winetricks and the wine processes it started
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+                proc.stdout.close()
+                proc.wait()
+                return None
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            data = tail + data
+            cut = data.rfind(b"\n") + 1
+            tail = data[cut:]
+            for m in _WINETRICKS_VERB_RE.finditer(data, 0, cut):
+                verb = m.group(1).decode("utf-8", errors="replace")
+                if verb in wanted and verb not in done:
+                    done.append(verb)
+                    self._log.add(f"Installing component: {verb} ({len(done)}/{total})...")
+                    self.progress_signal.emit(20 + int(len(done) / total * 70))
+            # One emit per chunk; the next read may block for minutes
+            self._log.flush()
+        proc.stdout.close()
+        return proc.wait()
+
+    def _winetricks_single(self, verb, env):
+        """``winetricks -q verb`` with the per-verb time limit."""
+        self._log.flush()
+        try:
+            subprocess.run(
+                ["winetricks", "-q", verb],
+                env=quiet_wine_env(env),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=WINETRICKS_VERB_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            self._log.add(f"Warning: {verb} timed out, continuing...")
+
+    def _run_winetricks(self, env):
+        done = []
+        pending = list(self.components)
+        total = len(pending)
+        self._log.add(f"Installing {len(pending)} component(s): {' '.join(pending)}")
+        self._log.flush()
+        while pending:
+            code = self._winetricks_batch(pending, env, done)
+            if code == 0:
+                break
+            failed = done[-1] if done and done[-1] in pending else pending[0]
+            if code is None:
+                # A verb hung: finish one verb at a time, each with its own limit
+                rest = pending[pending.index(failed):]
+                self._log.add(
+                    f"winetricks timed out at {failed}, installing the remaining "
+                    f"{len(rest)} component(s) one by one..."
+                )
+                for verb in rest:
+                    if verb not in done:
+                        done.append(verb)
+                    self._log.add(f"Installing component: {verb} ({len(done)}/{total})...")
+                    self.progress_signal.emit(20 + int(len(done) / total * 70))
+                    self._winetricks_single(verb, env)
+                break
+            # winetricks stops at the first failing verb – retry that one alone,
+            # then continue with the rest as one batch again
+            self._log.add(
+                f"winetricks exited with code {code} at {failed}, retrying it..."
+            )
+            self._winetricks_single(failed, env)
+            pending = pending[pending.index(failed) + 1:]
+        self.progress_signal.emit(90)
 
     def run(self):
         try:
-            env = self._make_env()
+            env = make_wine_env(self.prefix_path, self.wine_path)
 
-            # Step 1 – wineboot
-            self.log_signal.emit("Initializing Wine prefix...")
-            self.progress_signal.emit(5)
-            result = subprocess.run(
-                [self.wine_path, "wineboot", "--init"],
-                env=env,
-                capture_output=True, text=True,
-                encoding="utf-8", errors="replace", timeout=120,
-            )
-            if result.returncode != 0:
-                self.log_signal.emit(f"wineboot stderr: {result.stderr[:500]}")
+            # Step 1 – wineboot (an existing prefix is updated by Wine itself on
+            # the next start when the Wine build changed, so skip the explicit init)
+            if os.path.isfile(os.path.join(self.prefix_path, "system.reg")):
+                self._log.add("Prefix already initialized, skipping wineboot.")
+            else:
+                self._log.add("Initializing Wine prefix...")
+                self._log.flush()
+                self.progress_signal.emit(5)
+                result = subprocess.run(
+                    [self.wine_path, "wineboot", "--init"],
+                    env=env,
+                    capture_output=True, text=True,
+                    encoding="utf-8", errors="replace", timeout=120,
+                )
+                if result.returncode != 0:
+                    self._log.add(f"wineboot stderr: {result.stderr[:500]}")
             self.progress_signal.emit(20)
 
-            # Step 2 – winetricks
+            # Step 2 – winetricks (one invocation for all verbs)
             if self.components:
-                total = len(self.components)
-                for i, comp in enumerate(self.components):
-                    self.log_signal.emit(f"Installing component: {comp} ({i+1}/{total})...")
-                    try:
-                        subprocess.run(
-                            ["winetricks", "-q", comp],
-                            env=env, capture_output=True, text=True,
-                            encoding="utf-8", errors="replace", timeout=300,
-                        )
-                    except subprocess.TimeoutExpired:
-                        self.log_signal.emit(f"Warning: {comp} timed out, continuing...")
-                    pct = 20 + int((i + 1) / total * 70)
-                    self.progress_signal.emit(pct)
+                self._run_winetricks(env)
 
             self.progress_signal.emit(95)
-            self.log_signal.emit("Wine environment setup completed.")
-            self.finished_signal.emit(True)
-
+            self._log.add("Wine environment setup completed.")
+            ok = True
         except Exception as e:
-            self.log_signal.emit(f"Error during Wine setup: {e}")
-            self.finished_signal.emit(False)
+            self._log.add(f"Error during Wine setup: {e}")
+            ok = False
+        self._log.flush()
+        self.finished_signal.emit(ok)
 
 
 class InstallerRunnerThread(QThread):
     """Run an .exe installer inside Wine."""
-    log_signal = pyqtSignal(str)
+    log_batch_signal = pyqtSignal(list)
     finished_signal = pyqtSignal(bool)
 
+    # Wine "err:" lines shown live (fixme/trace noise only feeds the tail)
+    MAX_LIVE_ERRORS = 200
+
     def __init__(self, wine_path, prefix_path, exe_path):
         super().__init__()
         self.wine_path = wine_path
         self.prefix_path = prefix_path
         self.exe_path = exe_path
-
-    def run(self):
-        try:
-            env = os.environ.copy()
-            env["WINEPREFIX"] = self.prefix_path
-            self.log_signal.emit(f"Running installer: {self.exe_path}")
-            bitness = detect_pe_bitness(self.exe_path)
-            if bitness == "x86" and not wine_supports_32bit(self.wine_path):
-                self.log_signal.emit(
-                    "This installer appears to be 32-bit, but the bundled Wine build is 64-bit only."
-                )
-                self.log_signal.emit(
-                    "Please use a 64-bit installer (e.g. Set-up.exe) or rebuild with WoW64 (32-bit) support."
-                )
-                self.finished_signal.emit(False)
-                return
-            proc = subprocess.run(
-                [self.wine_path, self.exe_path],
-                env=env, capture_output=True, text=True,
-                encoding="utf-8", errors="replace",
+        self._log = LogBatcher(self.log_batch_signal.emit)
+
+    def _stream_output(self, proc):
+        """
+        Read the installer's merged output as it arrives (bounded memory).
+        Returns (last lines, {"vulkan", "wow64"} hints seen).
+        """
+        fd = proc.stdout.fileno()
+        tail = collections.deque(maxlen=40)
+        hints = set()
+        live = 0
+        pending = b""
+        while True:
+            data = os.read(fd, 65536)
+            if data:
+                *lines, pending = (pending + data).split(b"\n")
+            else:
+                lines, pending = [pending], b""
+            for raw in lines:
+                line = raw.decode("utf-8", errors="replace").rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                low = line.lower()
+                if "vulkan" in low or "dri3" in low:
+                    hints.add("vulkan")
+                if "syswow64" in low and "ntdll.dll" in low:
+                    hints.add("wow64")
+                if line.startswith("err:") and live < self.MAX_LIVE_ERRORS:
+                    self._log.add(line)
+                    live += 1
+            self._log.flush()
+            if not data:
+                break
+        proc.stdout.close()
+        return tail, hints
+
+    def _run(self):
+        env = make_wine_env(self.prefix_path, self.wine_path)
+        self._log.add(f"Running installer: {self.exe_path}")
+        bitness = detect_pe_bitness(self.exe_path)
+        if bitness == "x86" and not wine_supports_32bit(self.wine_path):
+            self._log.add(
+                "This installer appears to be 32-bit, but the bundled Wine build is 64-bit only."
             )
-            ps_exe = find_photoshop_exe(self.prefix_path)
-            if ps_exe:
-                self.log_signal.emit(
-                    f"<font color='#4caf50'>Photoshop detected: {ps_exe}</font>"
+            self._log.add(
+                "Please use a 64-bit installer (e.g. Set-up.exe) or rebuild with WoW64 (32-bit) support."
+            )
+            return False
+        self._log.flush()
+        proc = subprocess.Popen(
+            [self.wine_path, self.exe_path],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        )
+        tail, hints = self._stream_output(proc)
+        returncode = proc.wait()
+        ps_exe = find_photoshop_exe(self.prefix_path)
+        if ps_exe:
+            self._log.add(
+                f"<font color='#4caf50'>Photoshop detected: {ps_exe}</font>"
+            )
+            if returncode != 0:
+                self._log.add(
+                    f"<font color='#ff9800'>Installer exit code {returncode}, "
+                    "but Photoshop appears installed.</font>"
                 )
-                if proc.returncode != 0:
-                    self.log_signal.emit(
-                        f"<font color='#ff9800'>Installer exit code {proc.returncode}, "
-                        "but Photoshop appears installed.</font>"
-                    )
-                else:
-                    self.log_signal.emit("Installer process finished.")
-                self.finished_signal.emit(True)
-            elif proc.returncode != 0:
-                self.log_signal.emit(f"Installer exited with code {proc.returncode}")
-                if proc.stderr:
-                    self.log_signal.emit(proc.stderr[:1000])
-                    err_lower = proc.stderr.lower()
-                    if "vulkan" in err_lower or "dri3" in err_lower:
-                        self.log_signal.emit(
-                            "Hint: Vulkan/DRI3 errors detected. Try switching GPU backend to OpenGL (wined3d)."
-                        )
-                    if "syswow64" in err_lower and "ntdll.dll" in err_lower:
-                        self.log_signal.emit(
-                            "Hint: Missing syswow64 indicates a 32-bit app running on 64-bit-only Wine."
-                        )
-                self.finished_signal.emit(False)
             else:
-                self.log_signal.emit(
-                    "<font color='#ff9800'>Installer finished but Photoshop.exe was not found. "
-                    "Check the install path or click Refresh Status.</font>"
+                self._log.add("Installer process finished.")
+            return True
+        if returncode != 0:
+            self._log.add(f"Installer exited with code {returncode}")
+            if tail:
+                self._log.add("\n".join(tail)[-1000:])
+            if "vulkan" in hints:
+                self._log.add(
+                    "Hint: Vulkan/DRI3 errors detected. Try switching GPU backend to OpenGL (wined3d)."
                 )
-                self.finished_signal.emit(False)
+            if "wow64" in hints:
+                self._log.add(
+                    "Hint: Missing syswow64 indicates a 32-bit app running on 64-bit-only Wine."
+                )
+            return False
+        self._log.add(
+            "<font color='#ff9800'>Installer finished but Photoshop.exe was not found. "
+            "Check the install path or click Refresh Status.</font>"
+        )
+        return False
+
+    def run(self):
+        try:
+            ok = self._run()
         except Exception as e:
-            self.log_signal.emit(f"Error running installer: {e}")
-            self.finished_signal.emit(False)
+            self._log.add(f"Error running installer: {e}")
+            ok = False
+        self._log.flush()
+        self.finished_signal.emit(ok)
 
 
 class CameraRawInstallThread(QThread):
@@ -917,7 +1801,7 @@ class CameraRawInstallThread(QThread):
             self.finished_signal.emit(False)
             return
 
-        env = make_wine_env()
+        env = quiet_wine_env(make_wine_env())
         dest = Path(tempfile.gettempdir()) / "CameraRaw_12_2_1.exe"
         try:
             self.log_signal.emit(f"Downloading Camera Raw from Adobe...")
@@ -926,6 +1810,7 @@ class CameraRawInstallThread(QThread):
             proc = subprocess.run(
                 [wine, str(dest)],
                 env=env,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                 timeout=600,
             )
             if proc.returncode == 0:
@@ -953,88 +1838,161 @@ class CameraRawInstallThread(QThread):
                 pass
 
 
+class CleanupThread(QThread):
+    """Delete the prefix ("prefix") or Adobe cache trees ("caches") off the GUI thread."""
+    log_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, paths, mode):
+        super().__init__()
+        self.paths = [os.fspath(p) for p in paths]
+        self.mode = mode
+
+    def run(self):
+        try:
+            if self.mode == "prefix":
+                # Kill wine processes first to prevent locks
+                self.log_signal.emit("Stopping Wine processes before deletion...")
+                killed, locks = kill_all_wine_processes()
+                if killed:
+                    self.log_signal.emit(f"  Killed: {', '.join(killed)}")
+                if locks > 0:
+                    self.log_signal.emit(f"  Removed {locks} lock file(s)")
+                for p in self.paths:
+                    self.log_signal.emit(f"Deleting prefix: {p}")
+                    discard_tree(p)
+            else:
+                for p in self.paths:
+                    self.log_signal.emit(f"  Removing: {os.path.basename(p)}")
+                remove_trees(self.paths)
+            self.finished_signal.emit(not any(os.path.exists(p) for p in self.paths))
+        except Exception as e:
+            self.log_signal.emit(f"Cleanup error: {e}")
+            self.finished_signal.emit(False)
+
+
 # ---------------------------------------------------------------------------
 # Main Window
 # ---------------------------------------------------------------------------
 
+# Log colours per level; messages without markup skip the HTML parser
+LOG_LEVEL_COLORS = {"ok": "#4caf50", "err": "#f44336", "warn": "#ff9800", "hint": "#888"}
+_HTML_TAG_RE = re.compile(r"<[a-zA-Z/][^>]*>")
+
+# Application stylesheet, built once at import instead of on every apply_theme()
+DARK_STYLESHEET = """
+    QMainWindow, QWidget {
+        background-color: #1a1a1a;
+        color: #e0e0e0;
+        font-family: 'Inter', 'Segoe UI', system-ui, sans-serif;
+        font-size: 13px;
+    }
+    #titleLabel {
+        font-size: 24px; font-weight: bold; color: #ffffff;
+    }
+    #menuBtn {
+        font-size: 22px; background: transparent; border: none; color: #b0b0b0;
+    }
+    #menuBtn:hover { color: #ffffff; }
+    #menuBtn::menu-indicator { image: none; }
+    #statusCard {
+        background-color: #252525; border: 1px solid #333;
+        border-radius: 12px; padding: 15px;
+    }
+    QPushButton {
+        background-color: #2a2a2a; color: #fff;
+        border: 1px solid #444; border-radius: 8px;
+        padding: 10px 20px; font-weight: 500;
+    }
+    QPushButton:hover { background-color: #3d3d3d; border-color: #555; }
+    QPushButton#primaryBtn {
+        background-color: #4caf50; border-color: #4caf50; font-weight: bold;
+    }
+    QPushButton#primaryBtn:hover { background-color: #45a049; }
+    QPushButton#dangerBtn {
+        background-color: #c62828; border-color: #c62828;
+    }
+    QPushButton#dangerBtn:hover { background-color: #e53935; }
+    QPushButton:disabled {
+        background-color: #1a1a1a; color: #555; border: 1px solid #333;
+    }
+    QGroupBox {
+        font-weight: bold; border: 1px solid #333;
+        border-radius: 8px; margin-top: 15px; padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin; left: 10px; padding: 0 5px; color: #888;
+    }
+    QScrollArea { border: none; background: transparent; }
+    QScrollBar:vertical {
+        border: none; background: #1a1a1a; width: 10px;
+    }
+    QScrollBar::handle:vertical {
+        background: #333; min-height: 20px; border-radius: 5px;
+    }
+    QProgressBar {
+        border: none; background-color: #1a1a1a; height: 8px;
+        border-radius: 4px; text-align: center;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #4ec9b0, stop:1 #5dd9c0);
+        border-radius: 4px;
+    }
+"""
+
+
 class PhotoshopInstallerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Photoshop for Linux")
         self.setMinimumSize(820, 620)
 
-        icon_path = os.path.join(get_base_dir(), "pstux_icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = app_icon()
+        if icon is not None:
+            self.setWindowIcon(QIcon(icon))
 
         self._active_thread = None
-        self.init_ui()
+        # Worker QThreads kept referenced until QThread.finished (after run())
+        self._threads = set()
+        # Set while a QProcess chain (packages, GPU backend) is running
+        self._process_chain_busy = False
+
+        # Log lines and progress from worker threads are buffered and applied
+        # at most once per frame (~60 Hz) instead of on every signal.
+        self._log_buffer = []
+        self._pending_progress = None
+        self._log_formats = {"info": QTextCharFormat()}
+        for level, color in LOG_LEVEL_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._log_formats[level] = fmt
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_ui_updates)
+        # Adobe caches removed by Deep Repair (resolved once, not per click)
+        user = os.environ.get("USER", "wineuser")
+        prefix = get_prefix_path()
+        self._repair_targets = tuple(
+            os.path.join(prefix, sub.format(user=user)) for sub in ADOBE_CACHE_SUBPATHS
+        )
+        # Finish deleting prefixes whose background rm was interrupted
+        sweep_discarded_trees(get_prefix_path())
         self.apply_theme()
+        self.init_ui()
         self.check_dependencies()
+        # Parse version_configs.json now: errors show at startup, clicks hit the cache
+        self._load_config()
 
     # ── Theme ──────────────────────────────────────────────────────────
 
     def apply_theme(self):
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #1a1a1a;
-                color: #e0e0e0;
-                font-family: 'Inter', 'Segoe UI', system-ui, sans-serif;
-                font-size: 13px;
-            }
-            #titleLabel {
-                font-size: 24px; font-weight: bold; color: #ffffff;
-            }
-            #menuBtn {
-                font-size: 22px; background: transparent; border: none; color: #b0b0b0;
-            }
-            #menuBtn:hover { color: #ffffff; }
-            #menuBtn::menu-indicator { image: none; }
-            #statusCard {
-                background-color: #252525; border: 1px solid #333;
-                border-radius: 12px; padding: 15px;
-            }
-            QPushButton {
-                background-color: #2a2a2a; color: #fff;
-                border: 1px solid #444; border-radius: 8px;
-                padding: 10px 20px; font-weight: 500;
-            }
-            QPushButton:hover { background-color: #3d3d3d; border-color: #555; }
-            QPushButton#primaryBtn {
-                background-color: #4caf50; border-color: #4caf50; font-weight: bold;
-            }
-            QPushButton#primaryBtn:hover { background-color: #45a049; }
-            QPushButton#dangerBtn {
-                background-color: #c62828; border-color: #c62828;
-            }
-            QPushButton#dangerBtn:hover { background-color: #e53935; }
-            QPushButton:disabled {
-                background-color: #1a1a1a; color: #555; border: 1px solid #333;
-            }
-            QGroupBox {
-                font-weight: bold; border: 1px solid #333;
-                border-radius: 8px; margin-top: 15px; padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin; left: 10px; padding: 0 5px; color: #888;
-            }
-            QScrollArea { border: none; background: transparent; }
-            QScrollBar:vertical {
-                border: none; background: #1a1a1a; width: 10px;
-            }
-            QScrollBar::handle:vertical {
-                background: #333; min-height: 20px; border-radius: 5px;
-            }
-            QProgressBar {
-                border: none; background-color: #1a1a1a; height: 8px;
-                border-radius: 4px; text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-                    stop:0 #4ec9b0, stop:1 #5dd9c0);
-                border-radius: 4px;
-            }
-        """)
+        # Application-wide and before init_ui (the entry point sets it before the
+        # window exists): widgets are polished once, not again after creation
+        app = QApplication.instance()
+        if app.styleSheet() != DARK_STYLESHEET:
+            app.setStyleSheet(DARK_STYLESHEET)
 
     # ── UI Layout ──────────────────────────────────────────────────────
 
@@ -1048,15 +2006,9 @@ class PhotoshopInstallerGUI(QMainWindow):
         # Header
         header = QHBoxLayout()
         logo = QLabel()
-        icon_path = os.path.join(get_base_dir(), "pstux_icon.png")
-        if os.path.exists(icon_path):
-            logo.setPixmap(
-                QPixmap(icon_path).scaled(
-                    64, 64,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+        logo_pixmap = app_icon(64)
+        if logo_pixmap is not None:
+            logo.setPixmap(logo_pixmap)
         header.addWidget(logo)
 
         title = QLabel("Photoshop for Linux")
@@ -1205,9 +2157,9 @@ class PhotoshopInstallerGUI(QMainWindow):
         btn_cfg.clicked.connect(self.open_winecfg)
         mt_l.addWidget(btn_cfg)
 
-        btn_gpu = QPushButton("Switch GPU Backend (Vulkan / GL)")
-        btn_gpu.clicked.connect(self.switch_gpu_backend)
-        mt_l.addWidget(btn_gpu)
+        self.gpu_btn = QPushButton("Switch GPU Backend (Vulkan / GL)")
+        self.gpu_btn.clicked.connect(self.switch_gpu_backend)
+        mt_l.addWidget(self.gpu_btn)
 
         btn_fix = QPushButton("Apply Photoshop Stability Fixes")
         btn_fix.clicked.connect(self.apply_ps_fixes)
@@ -1347,22 +2299,127 @@ class PhotoshopInstallerGUI(QMainWindow):
 
     # ── Helpers ────────────────────────────────────────────────────────
 
-    def log(self, msg):
-        self.log_output.append(msg)
+    def log(self, msg, level="info"):
+        self._log_buffer.append((level, msg))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _queue_progress(self, value):
+        self._pending_progress = value
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_ui_updates(self):
+        """Apply buffered log lines and the latest progress value."""
+        self._flush_timer.stop()
+        if self._log_buffer:
+            items, self._log_buffer = self._log_buffer, []
+            bar = self.log_output.verticalScrollBar()
+            at_bottom = bar.value() == bar.maximum()
+            doc = self.log_output.document()
+            cursor = QTextCursor(doc)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for level, msg in items:
+                if not doc.isEmpty():
+                    cursor.insertBlock()
+                if _HTML_TAG_RE.search(msg):
+                    color = LOG_LEVEL_COLORS.get(level)
+                    cursor.insertHtml(f"<font color='{color}'>{msg}</font>" if color else msg)
+                else:
+                    cursor.insertText(msg, self._log_formats[level])
+            cursor.endEditBlock()
+            if at_bottom:
+                bar.setValue(bar.maximum())
+        if self._pending_progress is not None:
+            self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = None
 
     def log_ok(self, msg):
-        self.log(f"<font color='#4caf50'>{msg}</font>")
+        self.log(msg, "ok")
 
     def log_err(self, msg):
-        self.log(f"<font color='#f44336'>{msg}</font>")
+        self.log(msg, "err")
+
+    def log_warn(self, msg):
+        self.log(msg, "warn")
+
+    def log_lines(self, lines):
+        """Slot for LogBatcher batches from worker threads."""
+        self._log_buffer.extend(("info", msg) for msg in lines)
+        if lines and not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def _wine_env(self):
         return make_wine_env()
 
+    def _start_process(self, cmd, env, on_done, timeout_ms=None, on_output=None):
+        """
+        Run cmd via QProcess without blocking the event loop.
+        on_done(exit_code) is called once; -1 on crash, timeout or failed start.
+        env=None inherits ours; on_output(line) gets stdout+stderr, else discarded.
+        """
+        proc = QProcess(self)
+        if env is not None:
+            qenv = QProcessEnvironment()
+            for k, v in env.items():
+                qenv.insert(k, v)
+            proc.setProcessEnvironment(qenv)
+        if on_output is None:
+            proc.setStandardOutputFile(QProcess.nullDevice())
+            proc.setStandardErrorFile(QProcess.nullDevice())
+        else:
+            proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+            partial = [b""]
+
+            def _read(final=False):
+                data = partial[0] + bytes(proc.readAllStandardOutput())
+                *lines, partial[0] = data.split(b"\n")
+                if final:
+                    # Last line without a trailing newline (e.g. a pkexec error)
+                    lines.append(partial[0])
+                    partial[0] = b""
+                for line in lines:
+                    text = line.decode("utf-8", "replace").rstrip()
+                    if text:
+                        on_output(text)
+
+            proc.readyReadStandardOutput.connect(_read)
+
+        done = []
+
+        def _finish(code):
+            if done:
+                return
+            done.append(code)
+            if on_output is not None:
+                _read(final=True)
+            proc.deleteLater()
+            on_done(code)
+
+        proc.finished.connect(
+            lambda code, status: _finish(
+                code if status == QProcess.ExitStatus.NormalExit else -1
+            )
+        )
+        proc.errorOccurred.connect(
+            lambda err: _finish(-1) if err == QProcess.ProcessError.FailedToStart else None
+        )
+        if timeout_ms:
+            timer = QTimer(proc)
+            timer.setSingleShot(True)
+            timer.timeout.connect(proc.kill)
+            timer.start(timeout_ms)
+        proc.start(cmd[0], cmd[1:])
+        return proc
+
     def _set_busy(self, busy, label="Working..."):
+        self._flush_ui_updates()
         self.setup_btn.setEnabled(not busy)
         self.run_inst_btn.setEnabled(not busy)
         self.tricks_btn.setEnabled(not busy)
+        self.deps_btn.setEnabled(not busy)
+        self.gpu_btn.setEnabled(not busy)
         if hasattr(self, "camera_raw_btn"):
             self.camera_raw_btn.setEnabled(not busy)
         if busy:
@@ -1373,75 +2430,23 @@ class PhotoshopInstallerGUI(QMainWindow):
             self.cancel_btn.hide()
             self._active_thread = None
 
-    def _kill_all_wine_processes(self):
-        """Forcefully kill ALL Wine-related processes and clean up locks."""
-        killed = []
-
-        # Step 1: graceful wineserver shutdown
-        wineserver = get_wine_server()
-        if wineserver:
-            try:
-                subprocess.run(
-                    [wineserver, "-k"], timeout=5, capture_output=True
-                )
-                killed.append("wineserver (graceful)")
-            except Exception:
-                pass
-
-        # Step 2: forcefully kill wineserver if still running
-        if wineserver:
-            try:
-                subprocess.run(
-                    [wineserver, "-k9"], timeout=5, capture_output=True
-                )
-            except Exception:
-                pass
-
-        # Step 3: kill all Wine-related processes by name
-        wine_procs = [
-            "wine", "wine64", "wine-preloader", "wine64-preloader",
-            "wineserver", "wineboot", "winedbg", "winetricks",
-            "msiexec.exe", "services.exe", "plugplay.exe",
-            "svchost.exe", "rpcss.exe", "explorer.exe",
-        ]
-        for proc_name in wine_procs:
-            try:
-                result = subprocess.run(
-                    ["pkill", "-9", "-f", proc_name],
-                    capture_output=True, timeout=3,
-                )
-                if result.returncode == 0:
-                    killed.append(proc_name)
-            except Exception:
-                pass
+    def _busy_guard(self):
+        """Log and return True while a worker thread or QProcess chain is running."""
+        if self._process_chain_busy or any(t.isRunning() for t in self._threads):
+            self.log_err("Another operation is still running. Wait for it or press Cancel.")
+            return True
+        return False
 
-        # Step 4: clean lock files from the prefix
-        prefix = Path(get_prefix_path())
-        locks_cleaned = 0
-        if prefix.exists():
-            # Remove .lck files
-            for lck in prefix.rglob("*.lck"):
-                try:
-                    lck.unlink()
-                    locks_cleaned += 1
-                except Exception:
-                    pass
-            # Remove wineserver socket directory
-            server_dir = prefix / ".wineserver"
-            if server_dir.exists():
-                shutil.rmtree(server_dir, ignore_errors=True)
-                locks_cleaned += 1
-            # Remove /tmp wineserver sockets for this prefix
-            try:
-                import glob
-                for sock in glob.glob("/tmp/.wine-*"):
-                    if os.path.isdir(sock):
-                        shutil.rmtree(sock, ignore_errors=True)
-                        locks_cleaned += 1
-            except Exception:
-                pass
+    def _start_thread(self, thread):
+        """Start a worker; it stays referenced until it has really finished."""
+        self._threads.add(thread)
+        thread.finished.connect(lambda t=thread: self._release_thread(t))
+        self._active_thread = thread
+        thread.start()
 
-        return killed, locks_cleaned
+    def _release_thread(self, thread):
+        self._threads.discard(thread)
+        thread.deleteLater()
 
     def _cancel_operation(self):
         """Cancel the currently running background operation."""
@@ -1457,57 +2462,56 @@ class PhotoshopInstallerGUI(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.log("<font color='#ff9800'>\u26a0 Cancelling operation...</font>")
+                self.log_warn("\u26a0 Cancelling operation...")
 
                 # Terminate the thread
                 self._active_thread.terminate()
                 self._active_thread.wait(3000)
 
                 # Kill all wine processes and clean locks
-                killed, locks = self._kill_all_wine_processes()
+                killed, locks = kill_all_wine_processes()
 
                 if killed:
-                    self.log(f"<font color='#ff9800'>  Killed processes: {', '.join(killed)}</font>")
+                    self.log_warn(f"  Killed processes: {', '.join(killed)}")
                 if locks > 0:
-                    self.log(f"<font color='#ff9800'>  Removed {locks} lock file(s)</font>")
+                    self.log_warn(f"  Removed {locks} lock file(s)")
 
                 self._set_busy(False)
                 self.progress_bar.setValue(0)
+                self.log_warn("Operation cancelled. Environment cleaned up.")
                 self.log(
-                    "<font color='#ff9800'>Operation cancelled. "
-                    "Environment cleaned up.</font>"
-                )
-                self.log(
-                    "<font color='#888'>Tip: Use 'Full Environment Reset' if you "
-                    "still have issues, or 'One-Click Setup' to rebuild.</font>"
+                    "Tip: Use 'Full Environment Reset' if you "
+                    "still have issues, or 'One-Click Setup' to rebuild.",
+                    "hint",
                 )
                 self._refresh_status()
 
     # ── Dependency check ──────────────────────────────────────────────
 
-    def check_dependencies(self):
-        self._checker = DependencyChecker()
-        self._checker.status_signal.connect(self._on_deps_checked)
-        self._checker.start()
+    def check_dependencies(self, then=None):
+        """Probe dependencies on a pooled thread; then() runs after the UI update."""
+        checker = DependencyChecker()
+        self._dep_signals = checker.signals
+        self._dep_signals.status_signal.connect(self._on_deps_checked)
+        if then is not None:
+            self._dep_signals.status_signal.connect(lambda _results: then())
+        QThreadPool.globalInstance().start(checker)
 
     def _on_deps_checked(self, results):
+        all_ok = all(results.values())
         lines = ["<b>Runtime Requirements:</b><br>"]
-        all_ok = True
-        for name, ok in results.items():
-            icon = "\u2705" if ok else "\u274c"
-            lines.append(f"{icon} {name}<br>")
-            if not ok:
-                all_ok = False
-
+        lines.extend(
+            ("\u2705 " if ok else "\u274c ") + f"{name}<br>"
+            for name, ok in results.items()
+        )
         if all_ok:
             lines.append("<br><font color='#4caf50'>All requirements met!</font>")
-            self.setup_btn.setEnabled(True)
         else:
             lines.append(
                 "<br><font color='#f44336'>Some requirements are missing. "
                 "Click 'Install System Packages' first.</font>"
             )
-            self.setup_btn.setEnabled(False)
+        self.setup_btn.setEnabled(all_ok)
 
         self.dep_label.setText("".join(lines))
         self._refresh_status()
@@ -1560,6 +2564,8 @@ class PhotoshopInstallerGUI(QMainWindow):
             self.log_err("Wine binary not found! Cannot proceed.")
             return
 
+        if self._busy_guard():
+            return
         config = self._load_config()
         if not config:
             return
@@ -1570,12 +2576,11 @@ class PhotoshopInstallerGUI(QMainWindow):
 
         components = merge_winetricks_components(config.get("winetricks", []))
         self.log(f"Winetricks: {', '.join(components)}")
-        self._setup_thread = WineSetupThread(get_prefix_path(), wine, components)
-        self._setup_thread.log_signal.connect(self.log)
-        self._setup_thread.progress_signal.connect(self.progress_bar.setValue)
-        self._setup_thread.finished_signal.connect(self._on_setup_finished)
-        self._active_thread = self._setup_thread
-        self._setup_thread.start()
+        thread = WineSetupThread(get_prefix_path(), wine, components)
+        thread.log_batch_signal.connect(self.log_lines)
+        thread.progress_signal.connect(self._queue_progress)
+        thread.finished_signal.connect(self._on_setup_finished)
+        self._start_thread(thread)
 
     def _on_setup_finished(self, success):
         self._set_busy(False)
@@ -1613,21 +2618,23 @@ class PhotoshopInstallerGUI(QMainWindow):
             self.log_err("Wine binary not found!")
             return
 
+        if self._busy_guard():
+            return
         self._set_busy(True, "Running installer...")
-        self._runner = InstallerRunnerThread(wine, get_prefix_path(), exe)
-        self._runner.log_signal.connect(self.log)
-        self._runner.finished_signal.connect(self._on_installer_finished)
-        self._active_thread = self._runner
-        self._runner.start()
+        thread = InstallerRunnerThread(wine, get_prefix_path(), exe)
+        thread.log_batch_signal.connect(self.log_lines)
+        thread.finished_signal.connect(self._on_installer_finished)
+        self._start_thread(thread)
 
     def _on_installer_finished(self, success):
         self._set_busy(False)
+        _PS_EXE_CACHE.clear()  # a new or different version may be installed now
         ps = find_photoshop_exe()
         if ps:
             if not success:
-                self.log(
-                    "<font color='#ff9800'>Installer reported an error, but Photoshop was found — "
-                    "treating install as successful.</font>"
+                self.log_warn(
+                    "Installer reported an error, but Photoshop was found — "
+                    "treating install as successful."
                 )
             self.log_ok("Installer finished. Applying post-install fixes...")
             self.apply_adobe_runtime_fixes(quiet=True)
@@ -1689,6 +2696,8 @@ class PhotoshopInstallerGUI(QMainWindow):
         if not Path(get_prefix_path()).exists():
             self.log_err("Run One-Click Setup first.")
             return
+        if self._busy_guard():
+            return
 
         reply = QMessageBox.question(
             self,
@@ -1703,11 +2712,10 @@ class PhotoshopInstallerGUI(QMainWindow):
             return
 
         self._set_busy(True, "Installing Camera Raw...")
-        self._camera_raw_thread = CameraRawInstallThread()
-        self._camera_raw_thread.log_signal.connect(self.log)
-        self._camera_raw_thread.finished_signal.connect(self._on_camera_raw_finished)
-        self._active_thread = self._camera_raw_thread
-        self._camera_raw_thread.start()
+        thread = CameraRawInstallThread()
+        thread.log_signal.connect(self.log)
+        thread.finished_signal.connect(self._on_camera_raw_finished)
+        self._start_thread(thread)
 
     def _on_camera_raw_finished(self, success):
         self._set_busy(False)
@@ -1726,10 +2734,23 @@ class PhotoshopInstallerGUI(QMainWindow):
             app_dir.mkdir(parents=True, exist_ok=True)
             icon_dir.mkdir(parents=True, exist_ok=True)
 
-            src_icon = os.path.join(get_base_dir(), "pstux_icon.png")
+            src_icon = ICON_PATH
             dest_icon = str(icon_dir / "photoshop-linux.png")
             if os.path.isfile(src_icon):
-                shutil.copy2(src_icon, dest_icon)
+                # Hardlink when possible (same filesystem, not inside the AppImage)
+                try:
+                    os.link(src_icon, dest_icon)
+                except FileExistsError:
+                    if not os.path.samefile(src_icon, dest_icon):
+                        # Replace, never write into it: it may be a hardlink
+                        # to another checkout's icon
+                        os.unlink(dest_icon)
+                        try:
+                            os.link(src_icon, dest_icon)
+                        except OSError:
+                            copy_file_in_kernel(src_icon, dest_icon)
+                except OSError:
+                    copy_file_in_kernel(src_icon, dest_icon)
 
             appimage = os.environ.get("APPIMAGE")
             if appimage:
@@ -1744,7 +2765,8 @@ class PhotoshopInstallerGUI(QMainWindow):
 
             # Installer entry
             installer_desktop = app_dir / "photoshop-installer.desktop"
-            installer_desktop.write_text(
+            write_desktop_file(
+                installer_desktop,
                 "[Desktop Entry]\n"
                 "Type=Application\n"
                 "Name=Photoshop Installer & Maintenance\n"
@@ -1752,19 +2774,17 @@ class PhotoshopInstallerGUI(QMainWindow):
                 f"Exec={exec_installer}\n"
                 f"Icon={dest_icon}\n"
                 "Terminal=false\n"
-                "Categories=Graphics;Settings;\n"
+                "Categories=Graphics;Settings;\n",
             )
-            installer_desktop.chmod(0o644)
 
             # Direct launch entry (only if installed)
             ps = self._find_photoshop_exe()
             if ps:
                 launch_desktop = app_dir / "photoshop-app.desktop"
-                launch_desktop.write_text(
+                write_desktop_file(
+                    launch_desktop,
                     build_photoshop_desktop_entry(exec_launch, dest_icon),
-                    encoding="utf-8",
                 )
-                launch_desktop.chmod(0o644)
                 register_psd_file_association(app_dir)
                 self.log_ok(
                     "Photoshop launcher added with PSD file association "
@@ -1829,7 +2849,7 @@ class PhotoshopInstallerGUI(QMainWindow):
             return
 
         self.log("<b>Uninstalling Photoshop...</b>")
-        self._kill_all_wine_processes()
+        kill_all_wine_processes()
 
         try:
             result = uninstall_photoshop_from_prefix()
@@ -1859,44 +2879,71 @@ class PhotoshopInstallerGUI(QMainWindow):
     # ── System Packages ───────────────────────────────────────────────
 
     def install_missing_deps(self):
+        if self._busy_guard():
+            return
         distro = detect_distro()
         self.log(f"Detected distribution family: <b>{distro}</b>")
 
-        pkg_map = {
-            "debian": "sudo apt update && sudo apt install -y winetricks libxcb-cursor0",
-            "arch": "sudo pacman -S --noconfirm winetricks",
-            "fedora": "sudo dnf install -y winetricks",
-            "suse": "sudo zypper install -y winetricks",
-        }
-        cmd = pkg_map.get(distro)
-        if not cmd:
+        if distro not in RUNTIME_PACKAGES:
             self.log_err(
                 f"Unsupported distro '{distro}'. "
                 "Please install 'winetricks' manually."
             )
             return
 
-        self.log(f"Running: {cmd}")
-        self._set_busy(True, "Installing packages...")
+        # One package-manager chain at a time (a second one would hit the lock)
+        self._process_chain_busy = True
+        self._set_busy(True, "Checking installed packages...")
+        query = package_query_command(distro)
+        if query is None:
+            self._on_packages_queried(distro, [])
+            return
+        lines = []
+        self._start_process(
+            query, None, lambda _code: self._on_packages_queried(distro, lines),
+            timeout_ms=30000, on_output=lines.append,
+        )
+
+    def _on_packages_queried(self, distro, query_lines):
+        """Install only what the package database does not list yet."""
+        missing = missing_runtime_packages(distro, query_lines)
+        if not missing:
+            self.log_ok(
+                "Runtime packages already installed: "
+                + ", ".join(RUNTIME_PACKAGES[distro])
+            )
+            self._on_packages_installed()
+            return
 
-        def _worker():
-            try:
-                subprocess.run(cmd, shell=True, check=True)
-            except Exception as e:
-                print(f"Package install error: {e}")
+        cmds = package_install_commands(distro, missing)
+        self.log(f"Running as root ({cmds[0][0]}): {package_install_script(distro, missing)}")
+        self.progress_label.setText("Installing packages...")
+        self._run_package_cmds(cmds)
 
-        t = threading.Thread(target=_worker, daemon=True)
-        t.start()
+    def _run_package_cmds(self, cmds):
+        """Run the package-manager commands in order via QProcess (&&-style)."""
+        if not cmds:
+            self._on_packages_installed()
+            return
 
-        def _recheck():
-            if t.is_alive():
-                QTimer.singleShot(2000, _recheck)
+        def _done(code):
+            if code == 0:
+                self._run_package_cmds(cmds[1:])
+            elif cmds[0][0] == "pkexec" and code in (126, 127):
+                self.log_err("Package install cancelled: authentication was not granted.")
+                self._on_packages_installed()
             else:
-                self._set_busy(False)
-                self.check_dependencies()
-                self.log("Dependency check refreshed.")
+                self.log_err(f"Package install error: {' '.join(cmds[0])} (exit {code})")
+                self._on_packages_installed()
 
-        QTimer.singleShot(2000, _recheck)
+        self._start_process(
+            cmds[0], None, _done, on_output=lambda line: self.log(f"  {line}")
+        )
+
+    def _on_packages_installed(self):
+        self._process_chain_busy = False
+        self._set_busy(False)
+        self.check_dependencies(then=lambda: self.log("Dependency check refreshed."))
 
     # ── Winetricks only ───────────────────────────────────────────────
 
@@ -1905,10 +2952,13 @@ class PhotoshopInstallerGUI(QMainWindow):
         if not wine:
             self.log_err("Wine binary not found!")
             return
-        if not shutil.which("winetricks"):
+        if not which("winetricks"):
             self.log_err("winetricks is not installed. Use 'Install System Packages' first.")
             return
 
+        if self._busy_guard():
+            return
+
         config = self._load_config()
         if not config:
             return
@@ -1916,12 +2966,11 @@ class PhotoshopInstallerGUI(QMainWindow):
         self._set_busy(True, "Installing winetricks components...")
         self.progress_bar.setValue(0)
         components = merge_winetricks_components(config.get("winetricks", []))
-        self._wt_thread = WineSetupThread(get_prefix_path(), wine, components)
-        self._wt_thread.log_signal.connect(self.log)
-        self._wt_thread.progress_signal.connect(self.progress_bar.setValue)
-        self._wt_thread.finished_signal.connect(self._on_setup_finished)
-        self._active_thread = self._wt_thread
-        self._wt_thread.start()
+        thread = WineSetupThread(get_prefix_path(), wine, components)
+        thread.log_batch_signal.connect(self.log_lines)
+        thread.progress_signal.connect(self._queue_progress)
+        thread.finished_signal.connect(self._on_setup_finished)
+        self._start_thread(thread)
 
     # ── Wine Config ───────────────────────────────────────────────────
 
@@ -1931,10 +2980,11 @@ class PhotoshopInstallerGUI(QMainWindow):
             self.log_err("Wine binary not found!")
             return
         self.log("Opening winecfg...")
-        env = self._wine_env()
+        env = quiet_wine_env(self._wine_env())
         subprocess.Popen(
             [wine, "winecfg"], env=env,
             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
 
     # ── DPI Scaling ───────────────────────────────────────────────────
@@ -1952,7 +3002,7 @@ class PhotoshopInstallerGUI(QMainWindow):
             return
 
         current_dpi = 96
-        env = self._wine_env()
+        env = quiet_wine_env(self._wine_env())
         try:
             result = subprocess.run(
                 [wine, "reg", "query",
@@ -2027,13 +3077,15 @@ class PhotoshopInstallerGUI(QMainWindow):
                     [wine, "reg", "add", r"HKCU\Control Panel\Desktop",
                      "/v", "LogPixels", "/t", "REG_DWORD",
                      "/d", str(new_dpi), "/f"],
-                    env=env, capture_output=True, timeout=15,
+                    env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=15,
                 )
                 subprocess.run(
                     [wine, "reg", "add", r"HKCU\Software\Wine\Fonts",
                      "/v", "LogPixels", "/t", "REG_DWORD",
                      "/d", str(new_dpi), "/f"],
-                    env=env, capture_output=True, timeout=15,
+                    env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=15,
                 )
                 self.log_ok(
                     f"DPI set to {new_dpi}. "
@@ -2046,6 +3098,8 @@ class PhotoshopInstallerGUI(QMainWindow):
     # ── GPU Backend ───────────────────────────────────────────────────
 
     def switch_gpu_backend(self):
+        if self._busy_guard():
+            return
         wine = get_wine_binary()
         if not wine:
             self.log_err("Wine binary not found!")
@@ -2118,24 +3172,19 @@ class PhotoshopInstallerGUI(QMainWindow):
 
         selected = group.checkedButton()
 
+        steps = []
         if selected == rb_dxvk:
             self.log("Setting renderer to <b>Vulkan (DXVK)</b>...")
             renderer = "vulkan"
         elif selected == rb_vkd3d:
             self.log("Setting renderer to <b>Vulkan (vkd3d-proton)</b>...")
             renderer = "vulkan"
-            if shutil.which("winetricks"):
+            if which("winetricks"):
                 self.log("Installing vkd3d-proton via winetricks...")
-                try:
-                    subprocess.run(
-                        ["winetricks", "-q", "vkd3d"],
-                        env=env, capture_output=True, text=True, timeout=120,
-                    )
-                    self.log_ok("vkd3d-proton installed.")
-                except subprocess.TimeoutExpired:
-                    self.log_err("vkd3d-proton install timed out.")
-                except Exception as e:
-                    self.log_err(f"vkd3d-proton install failed: {e}")
+                steps.append((
+                    ["winetricks", "-q", "vkd3d"], 120000,
+                    "vkd3d-proton installed.", "vkd3d-proton install failed",
+                ))
             else:
                 self.log_err(
                     "winetricks not found \u2013 cannot install vkd3d-proton. "
@@ -2150,18 +3199,34 @@ class PhotoshopInstallerGUI(QMainWindow):
         else:
             return
 
-        try:
-            subprocess.run(
-                [wine, "reg", "add", r"HKCU\Software\Wine\Direct3D",
-                 "/v", "renderer", "/t", "REG_SZ", "/d", renderer, "/f"],
-                env=env, capture_output=True, timeout=15,
-            )
-            self.log_ok(
-                "GPU backend updated. Restart Photoshop for changes to take effect."
-            )
+        steps.append((
+            [wine, "reg", "add", r"HKCU\Software\Wine\Direct3D",
+             "/v", "renderer", "/t", "REG_SZ", "/d", renderer, "/f"],
+            15000,
+            "GPU backend updated. Restart Photoshop for changes to take effect.",
+            "Failed to switch backend",
+        ))
+        self._process_chain_busy = True
+        self._set_busy(True, "Switching GPU backend...")
+        self._run_gpu_steps(steps, env)
+
+    def _run_gpu_steps(self, steps, env):
+        """Run the backend switch steps one after another via QProcess."""
+        if not steps:
+            self._process_chain_busy = False
+            self._set_busy(False)
             self._refresh_status()
-        except Exception as e:
-            self.log_err(f"Failed to switch backend: {e}")
+            return
+        cmd, timeout_ms, ok_msg, err_msg = steps[0]
+
+        def _done(code):
+            if code == 0:
+                self.log_ok(ok_msg)
+            else:
+                self.log_err(f"{err_msg} (exit {code}).")
+            self._run_gpu_steps(steps[1:], env)
+
+        self._start_process(cmd, env, _done, timeout_ms)
 
     # ── GPU Detection ─────────────────────────────────────────────────
 
@@ -2290,69 +3355,65 @@ class PhotoshopInstallerGUI(QMainWindow):
         if not quiet:
             self.log("<b>Applying Photoshop stability fixes...</b>")
 
-        overrides = [
-            ("atmlib", "native"),
-            ("gdiplus", "builtin,native"),
-            ("riched20", "builtin,native"),
+        wanted = [
+            (r"Software\Wine\AppDefaults\Photoshop.exe\DllOverrides", dll, mode)
+            for dll, mode in PHOTOSHOP_DLL_OVERRIDES
         ]
-        try:
-            for dll, mode in overrides:
-                if not quiet:
-                    self.log(f"  DLL override: {dll} → {mode}")
-                subprocess.run(
-                    [wine, "reg", "add",
-                     r"HKCU\Software\Wine\AppDefaults\Photoshop.exe\DllOverrides",
-                     "/v", dll, "/t", "REG_SZ", "/d", mode, "/f"],
-                    env=env, capture_output=True, timeout=15,
-                )
-
+        wanted += [
+            (rf"Software\Adobe\Photoshop\{ver}", "InAppMsg_CanShowHomeScreen", 0)
+            for ver in PHOTOSHOP_REG_VERSIONS
+        ]
+        # Only import values user.reg doesn't already have
+        pending = pending_user_reg_values(get_prefix_path(), wanted)
+        if not pending:
             if not quiet:
-                self.log("  Disabling Photoshop Home Screen...")
-            for ver in ("150.0", "160.0", "170.0"):
-                subprocess.run(
-                    [wine, "reg", "add",
-                     rf"HKCU\Software\Adobe\Photoshop\{ver}",
-                     "/v", "InAppMsg_CanShowHomeScreen",
-                     "/t", "REG_DWORD", "/d", "0", "/f"],
-                    env=env, capture_output=True, timeout=15,
-                )
+                self.log_ok("Stability fixes already applied.")
+            return
 
+        if not quiet:
+            for key, name, value in pending:
+                self.log(f"  {key}: {name} → {value}")
+        try:
+            result = import_reg_file(wine, env, build_reg_file(pending))
+            if result.returncode != 0:
+                err = (result.stderr or result.stdout or "").strip()
+                self.log_err(
+                    f"Stability fixes: regedit failed (exit {result.returncode})"
+                    + (f": {err[:200]}" if err else "")
+                )
+                return
             if not quiet:
                 self.log_ok("All stability fixes applied.")
+        except subprocess.TimeoutExpired:
+            self.log_err("Stability fixes timed out (Wine busy).")
         except Exception as e:
             self.log_err(f"Fix error: {e}")
 
-    def _set_app_winver(self, exe_name, version):
-        """Set application-specific Windows version in Wine registry."""
-        wine = get_wine_binary()
-        if not wine:
-            return
-        env = self._wine_env()
-        try:
-            subprocess.run(
-                [wine, "reg", "add",
-                 rf"HKCU\Software\Wine\AppDefaults\{exe_name}",
-                 "/v", "Version", "/t", "REG_SZ", "/d", version, "/f"],
-                env=env, capture_output=True, timeout=10,
-            )
-        except Exception:
-            pass
-
     def apply_adobe_winver_overrides(self):
         """Force Windows 7 mode for specific Adobe services to avoid crashes."""
         self.log("Applying Windows version overrides for Adobe services...")
-        adobe_services = [
-            "Creative Cloud.exe",
-            "Creative Cloud Helper.exe",
-            "Creative Cloud UI Helper.exe",
-            "CCXProcess.exe",
-            "AdobeIPCBroker.exe",
-            "Adobe Crash Processor.exe",
-            "node.exe",
-        ]
-        for service in adobe_services:
+        wine = get_wine_binary()
+        if not wine:
+            return
+        for service in ADOBE_WIN7_SERVICES:
             self.log(f"  Setting {service} to win7 mode")
-            self._set_app_winver(service, "win7")
+        wanted = [
+            (rf"Software\Wine\AppDefaults\{service}", "Version", "win7")
+            for service in ADOBE_WIN7_SERVICES
+        ]
+        # All AppDefaults keys in one regedit import (one wine start, not seven)
+        pending = pending_user_reg_values(get_prefix_path(), wanted)
+        if pending:
+            try:
+                result = import_reg_file(
+                    wine, self._wine_env(), build_reg_file(pending), timeout=30
+                )
+            except Exception as e:
+                self.log_err(f"Version overrides failed: {e}")
+                return
+            if result.returncode != 0:
+                self.log_err(f"Version overrides: regedit failed (exit {result.returncode})")
+                return
         self.log_ok("Adobe version overrides applied.")
 
     def repair_vcrun_msvcp140(self):
@@ -2381,7 +3442,7 @@ class PhotoshopInstallerGUI(QMainWindow):
                     subprocess.run(["cabextract", "-q", "-d", tmp_dir, str(redist_path)], check=True)
                     chunks = list(Path(tmp_dir).glob("a*"))
                     for chunk in chunks:
-                        subprocess.run(["cabextract", "-q", "-F", "msvcp140.dll", "-d", tmp_dir, str(chunk)], capture_output=True)
+                        subprocess.run(["cabextract", "-q", "-F", "msvcp140.dll", "-d", tmp_dir, str(chunk)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                         extracted = Path(tmp_dir) / "msvcp140.dll"
                         if extracted.exists():
                             v = subprocess.run(["file", "-b", str(extracted)], capture_output=True, text=True)
@@ -2429,27 +3490,11 @@ class PhotoshopInstallerGUI(QMainWindow):
             "WindowText": "219 220 222",
         }
 
-        reg_lines = [
-            "Windows Registry Editor Version 5.00",
-            "",
-            "[HKEY_CURRENT_USER\\Control Panel\\Colors]",
-        ]
-        for key, val in colors.items():
-            reg_lines.append(f'"{key}"="{val}"')
-        reg_body = "\r\n".join(reg_lines) + "\r\n"
-
-        reg_path = None
+        reg_text = build_reg_file(
+            (r"Control Panel\Colors", key, val) for key, val in colors.items()
+        )
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".reg", delete=False, encoding="utf-8"
-            ) as f:
-                f.write(reg_body)
-                reg_path = f.name
-
-            result = subprocess.run(
-                [wine, "regedit", "/S", reg_path],
-                env=env, capture_output=True, text=True, timeout=60,
-            )
+            result = import_reg_file(wine, env, reg_text)
             if result.returncode != 0:
                 err = (result.stderr or result.stdout or "").strip()
                 self.log_err(
@@ -2465,12 +3510,6 @@ class PhotoshopInstallerGUI(QMainWindow):
             )
         except Exception as e:
             self.log_err(f"Failed to apply Dark Mode: {e}")
-        finally:
-            if reg_path:
-                try:
-                    os.unlink(reg_path)
-                except OSError:
-                    pass
 
     # ── Full Environment Reset ────────────────────────────────────────
 
@@ -2517,7 +3556,7 @@ class PhotoshopInstallerGUI(QMainWindow):
 
         # Step 1: Kill processes
         self.log("Step 1: Killing all Wine processes...")
-        killed, locks = self._kill_all_wine_processes()
+        killed, locks = kill_all_wine_processes()
         if killed:
             self.log(f"  Killed: {', '.join(killed)}")
         else:
@@ -2538,7 +3577,7 @@ class PhotoshopInstallerGUI(QMainWindow):
         prefix = Path(get_prefix_path())
         if delete_prefix and prefix.exists():
             self.log("Step 3: Deleting Wine prefix...")
-            shutil.rmtree(prefix, ignore_errors=True)
+            discard_tree(prefix)
             self.log_ok(f"  Prefix deleted: {prefix}")
         elif delete_prefix:
             self.log("Step 3: Prefix doesn't exist, nothing to delete.")
@@ -2552,7 +3591,7 @@ class PhotoshopInstallerGUI(QMainWindow):
             try:
                 result = subprocess.run(
                     ["pgrep", "-f", proc_name],
-                    capture_output=True, timeout=3,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3,
                 )
                 if result.returncode == 0:
                     remaining.append(proc_name)
@@ -2599,18 +3638,30 @@ class PhotoshopInstallerGUI(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        user = os.environ.get("USER", "wineuser")
-        targets = [
-            prefix / "drive_c" / "users" / user / "AppData" / "Local" / "Adobe" / "OOBE",
-            prefix / "drive_c" / "Program Files (x86)" / "Common Files" / "Adobe" / "SLCache",
-            prefix / "drive_c" / "ProgramData" / "Adobe" / "SLStore",
-        ]
+        existing = [p for p in self._repair_targets if os.path.isdir(p)]
+        if not existing:
+            self.log_ok("Deep repair: no Adobe caches to remove.")
+            return
         self.log("<b>Deep Repair – cleaning caches...</b>")
-        for p in targets:
-            if p.exists():
-                self.log(f"  Removing: {p.name}")
-                shutil.rmtree(p, ignore_errors=True)
-        self.log_ok("Deep repair finished.")
+        self._start_cleanup(existing, "caches", "Cleaning Adobe caches...",
+                            self._on_deep_repair_finished)
+
+    def _on_deep_repair_finished(self, success):
+        self._set_busy(False)
+        if success:
+            self.log_ok("Deep repair finished.")
+        else:
+            self.log_err("Deep repair could not remove all caches.")
+
+    def _start_cleanup(self, paths, mode, label, on_finished):
+        """Run a CleanupThread; the UI stays responsive while trees are deleted."""
+        if self._busy_guard():
+            return
+        self._set_busy(True, label)
+        thread = CleanupThread(paths, mode)
+        thread.log_signal.connect(self.log)
+        thread.finished_signal.connect(on_finished)
+        self._start_thread(thread)
 
     # ── Delete Prefix ─────────────────────────────────────────────────
 
@@ -2629,29 +3680,35 @@ class PhotoshopInstallerGUI(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Kill wine processes first to prevent locks
-        self.log("Stopping Wine processes before deletion...")
-        killed, locks = self._kill_all_wine_processes()
-        if killed:
-            self.log(f"  Killed: {', '.join(killed)}")
-        if locks > 0:
-            self.log(f"  Removed {locks} lock file(s)")
-
-        self.log(f"Deleting prefix: {prefix}")
-        shutil.rmtree(prefix, ignore_errors=True)
+        self._start_cleanup([prefix], "prefix", "Deleting Wine prefix...",
+                            self._on_clean_prefix_finished)
 
-        # Verify deletion
-        if prefix.exists():
+    def _on_clean_prefix_finished(self, success):
+        self._set_busy(False)
+        if success:
+            self.log_ok("Wine prefix deleted.")
+        else:
             self.log_err(
                 "Could not fully delete prefix. "
                 "Some files may be locked. Try 'Full Environment Reset'."
             )
-        else:
-            self.log_ok("Wine prefix deleted.")
         self._refresh_status()
 
     # ── Save Log ──────────────────────────────────────────────────────
 
+    # toPlainText() mapping for QTextDocument's in-block separators / nbsp
+    _BLOCK_TEXT_MAP = str.maketrans({"\u2028": "\n", "\u2029": "\n", "\xa0": " "})
+
+    def _write_log(self, f, scanner):
+        """Write the log block by block to binary ``f``, feeding ``scanner``."""
+        block = self.log_output.document().begin()
+        while block.isValid():
+            text = block.text().translate(self._BLOCK_TEXT_MAP)
+            scanner.feed(text)
+            f.write(text.encode("utf-8"))
+            f.write(b"\n")
+            block = block.next()
+
     def save_log(self):
         path, _ = QFileDialog.getSaveFileName(
             self, "Save Log", "photoshop_install_log.txt",
@@ -2659,14 +3716,15 @@ class PhotoshopInstallerGUI(QMainWindow):
         )
         if path:
             try:
-                body = self.log_output.toPlainText()
-                hints = analyze_wine_log(body)
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(body)
+                self._flush_ui_updates()
+                scanner = WineLogScanner()
+                with open(path, "wb", buffering=1 << 20) as f:
+                    self._write_log(f, scanner)
+                    hints = scanner.hints()
                     if hints:
-                        f.write("\n\n--- Diagnose-Hinweise ---\n")
+                        f.write("\n--- Diagnose-Hinweise ---\n".encode("utf-8"))
                         for h in hints:
-                            f.write(f"• {h}\n")
+                            f.write(f"• {h}\n".encode("utf-8"))
                 self.log_ok(f"Log saved: {path}")
                 if hints:
                     hint_html = "<br>".join(f"• {h}" for h in hints)
@@ -2707,9 +3765,8 @@ class PhotoshopInstallerGUI(QMainWindow):
 
     def _load_config(self):
         try:
-            cfg_path = os.path.join(get_base_dir(), "version_configs.json")
-            with open(cfg_path, "r") as f:
-                data = json.load(f)
+            cfg_path = VERSION_CONFIGS_PATH
+            data = read_version_configs(os.path.getmtime(cfg_path), cfg_path)
             # Use the first available config
             for key in ("cc2025", "cc2021"):
                 if key in data:
@@ -2721,48 +3778,16 @@ class PhotoshopInstallerGUI(QMainWindow):
             return None
 
 
-# ---------------------------------------------------------------------------
-# Direct launch mode (--launch)
-# ---------------------------------------------------------------------------
-
-def direct_launch():
-    """Launch Photoshop without showing the GUI (optional files after --launch)."""
-    wine = get_wine_binary()
-    if not wine:
-        print("ERROR: Wine binary not found.")
-        sys.exit(1)
-
-    prefix = Path(get_prefix_path())
-    ps = find_photoshop_exe(prefix)
-    if not ps:
-        print("ERROR: Photoshop.exe not found in prefix.")
-        print(f"Prefix: {prefix}")
-        sys.exit(1)
-
-    file_paths = collect_launch_file_args()
-    env = make_wine_env()
-    if file_paths:
-        print(f"Launching: {ps} with {len(file_paths)} file(s)")
-    else:
-        print(f"Launching: {ps}")
-    apply_adobe_runtime_fixes(prefix)
-    cmd = build_photoshop_launch_command(wine, ps, env, file_paths or None)
-    os.execvpe(cmd[0], cmd, env)
-
-
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    if "--launch" in sys.argv:
-        direct_launch()
-        sys.exit(0)
-
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
     os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
 
     app = QApplication(sys.argv)
+    app.setStyleSheet(DARK_STYLESHEET)
     window = PhotoshopInstallerGUI()
     window.show()
     sys.exit(app.exec())
@@ -67,26 +67,85 @@ for cross in i686-w64-mingw32-gcc x86_64-w64-mingw32-gcc; do
     fi
 done
 
+# Unpack the standalone Python in the background; it is independent of the
+# Wine build and only needed in Step 3. Staged next to the AppDir so the
+# final move is a rename; a stage left by a killed build is git-ignored.
+PY_STAGE="$PROJECT_DIR/.python-stage.$$"
+trap 'rm -rf "$PY_STAGE"' EXIT
+mkdir -p "$PY_STAGE"
+tar -xf "$PYTHON_TAR" -C "$PY_STAGE" &
+PY_EXTRACT_PID=$!
+
 # ── Step 1: Compile Wine 11.9 (cached) ────────────────────────────────────
 
-if [ -f "$WINE_BUILD_DIR/wine" ]; then
+# Compiler flags for the Unix and PE (mingw) parts. -pipe skips the temp
+# files between compiler stages; dropping Wine's default -g shrinks objects
+# and speeds up linking. -march=native is opt-in (WINE_BUILD_NATIVE=1) since
+# the AppImage has to run on other CPUs.
+WINE_CFLAGS="${WINE_BUILD_CFLAGS:--O2 -pipe}"
+if [ "${WINE_BUILD_NATIVE:-0}" = "1" ]; then
+    WINE_CFLAGS="$WINE_CFLAGS -march=native"
+fi
+
+# Fingerprint of the inputs (source tree + Adobe patches + CFLAGS). A cached build is
+# reused only while it matches; an unstamped cache is rebuilt once.
+WINE_BUILD_STAMP=$(
+    {
+        echo "$WINE_SOURCE"
+        echo "$WINE_CFLAGS"
+        # The source tree itself: revision + local edits for a git checkout,
+        # otherwise every file's path, size and mtime (the directory's own mtime
+        # misses edits deeper in the tree)
+        if [ -e "$WINE_SOURCE/.git" ]; then
+            git -C "$WINE_SOURCE" rev-parse HEAD
+            git -C "$WINE_SOURCE" status --porcelain --untracked-files=no
+            git -C "$WINE_SOURCE" diff HEAD | sha1sum
+        else
+            find "$WINE_SOURCE" -type f -printf '%P %s %T@\n' | LC_ALL=C sort
+        fi
+        # wine-patches/ is optional (see the patch step below)
+        if [ -d wine-patches ]; then
+            find wine-patches -path 'wine-patches/archive' -prune -o -type f -print0 \
+                | sort -z | xargs -0 -r sha1sum
+        fi
+    } | sha1sum | cut -d' ' -f1
+)
+CACHED_STAMP=""
+if [ -f "$WINE_BUILD_DIR/.build_stamp" ]; then
+    CACHED_STAMP=$(cat "$WINE_BUILD_DIR/.build_stamp")
+fi
+
+if [ -f "$WINE_BUILD_DIR/wine" ] && [ "$CACHED_STAMP" = "$WINE_BUILD_STAMP" ]; then
     echo "Wine 11.9 already compiled in $WINE_BUILD_DIR, skipping build."
 else
+    if [ -f "$WINE_BUILD_DIR/wine" ]; then
+        if [ -n "$CACHED_STAMP" ]; then
+            echo "Wine source or patches changed since the cached build, rebuilding."
+        else
+            echo "Cached build has no build stamp (unknown inputs), rebuilding."
+        fi
+    fi
     echo "=== Compiling Wine 11.9 (this takes 20-40 minutes) ==="
     echo "    Building in $WINE_BUILD_BASE to avoid spaces-in-path issues."
 
     rm -rf "$WINE_BUILD_DIR" "$WINE_BUILD_BASE"
     mkdir -p "$WINE_BUILD_BASE"/{src,build}
 
-    # Copy Wine source to a space-free temp directory
+    # Copy Wine source to a space-free temp directory. Hardlink the files when
+    # /tmp is on the same filesystem (no data copied); real copy otherwise.
     echo "Copying Wine source to temp build location..."
-    cp -a "$PROJECT_DIR/$WINE_SOURCE/." "$WINE_BUILD_BASE/src/"
+    if ! cp -al "$PROJECT_DIR/$WINE_SOURCE/." "$WINE_BUILD_BASE/src/" 2>/dev/null; then
+        rm -rf "$WINE_BUILD_BASE/src"
+        mkdir -p "$WINE_BUILD_BASE/src"
+        cp -a "$PROJECT_DIR/$WINE_SOURCE/." "$WINE_BUILD_BASE/src/"
+    fi
 
     # Apply Adobe Photoshop patches if they exist
     if [ -d "$PROJECT_DIR/wine-patches" ]; then
         echo "Applying Adobe Photoshop patches (msxml3 sources + unified diffs)..."
         if [ -d "$PROJECT_DIR/wine-patches/dlls/msxml3" ]; then
-            cp -af "$PROJECT_DIR/wine-patches/dlls/msxml3/." "$WINE_BUILD_BASE/src/dlls/msxml3/"
+            # --remove-destination: never write through a hardlink into $WINE_SOURCE
+            cp -a --remove-destination "$PROJECT_DIR/wine-patches/dlls/msxml3/." "$WINE_BUILD_BASE/src/dlls/msxml3/"
         fi
         if [ -d "$PROJECT_DIR/wine-patches/patches" ]; then
             echo "Applying unified diffs from wine-patches/patches/..."
@@ -100,16 +159,47 @@ else
     (
         cd "$WINE_BUILD_BASE/build"
 
+        # Route the host and mingw compilers through ccache when available so a
+        # rebuild (patch change, flag toggle, failed link) reuses objects. The
+        # build dir changes per run ($$), CCACHE_BASEDIR keeps hits path-independent.
+        CC_ARGS=()
+        if command -v ccache &>/dev/null; then
+            export CCACHE_DIR="${CCACHE_DIR:-$HOME/.cache/pstux-ccache}"
+            export CCACHE_MAXSIZE="${CCACHE_MAXSIZE:-5G}"
+            export CCACHE_BASEDIR="$WINE_BUILD_BASE"
+            CC_ARGS=(
+                CC="ccache gcc"
+                x86_64_CC="ccache x86_64-w64-mingw32-gcc"
+                i386_CC="ccache i686-w64-mingw32-gcc"
+            )
+            echo "Using ccache ($CCACHE_DIR)"
+        fi
+
         "$WINE_BUILD_BASE/src/configure" \
             --enable-archs=x86_64,i386 \
             --disable-tests \
-            --prefix="$WINE_BUILD_BASE/install"
-
-        NPROC=$(nproc 2>/dev/null || echo 4)
-        # Limit parallelism to avoid OOM on low-memory systems
-        NPROC=$((NPROC > 8 ? 8 : NPROC))
-        echo "Building with -j${NPROC}..."
-        make -j"$NPROC"
+            --prefix="$WINE_BUILD_BASE/install" \
+            CFLAGS="$WINE_CFLAGS" \
+            CROSSCFLAGS="$WINE_CFLAGS" \
+            ${CC_ARGS[@]+"${CC_ARGS[@]}"}
+
+        CPUS=$(nproc 2>/dev/null || echo 4)
+        # One spare job keeps the cores busy while another waits on I/O
+        NPROC=$((CPUS + 1))
+        # Limit parallelism by available memory (~1.5 GiB per job) instead of
+        # a fixed cap, so large machines use all cores without OOM on small ones
+        MEM_KB=$(awk '/^MemAvailable:/ {print $2}' /proc/meminfo 2>/dev/null || true)
+        if [ -n "$MEM_KB" ]; then
+            MEM_JOBS=$((MEM_KB / 1572864))
+            MEM_JOBS=$((MEM_JOBS < 1 ? 1 : MEM_JOBS))
+            NPROC=$((NPROC > MEM_JOBS ? MEM_JOBS : NPROC))
+        fi
+        NPROC="${WINE_BUILD_JOBS:-$NPROC}"
+        # Via MAKEFLAGS so the install step and every sub-make share the
+        # same jobserver (x86_64 + i386 are one tree with --enable-archs)
+        export MAKEFLAGS="-j${NPROC}"
+        echo "Building with ${MAKEFLAGS}..."
+        make
         make install
     )
 
@@ -120,6 +210,8 @@ else
     cp "$WINE_BUILD_BASE/build/wine" "$WINE_BUILD_DIR/wine" 2>/dev/null || true
     cp "$WINE_BUILD_BASE/install/bin/wine" "$WINE_BUILD_DIR/wine" 2>/dev/null || true
 
+    echo "$WINE_BUILD_STAMP" > "$WINE_BUILD_DIR/.build_stamp"
+
     # Cleanup temp build
     rm -rf "$WINE_BUILD_BASE"
 
@@ -150,7 +242,11 @@ fi
 # ── Step 3: Bundle Python ──────────────────────────────────────────────────
 
 echo "Extracting standalone Python..."
-tar -xf "$PYTHON_TAR" -C "$APP_DIR/usr/"
+if ! wait "$PY_EXTRACT_PID"; then
+    echo "ERROR: failed to extract $PYTHON_TAR"
+    exit 1
+fi
+mv "$PY_STAGE"/* "$APP_DIR/usr/"
 # The tarball typically extracts to 'python/' – rename if needed
 if [ ! -d "$APP_DIR/usr/python" ] && [ -d "$APP_DIR/usr/install" ]; then
     mv "$APP_DIR/usr/install" "$APP_DIR/usr/python"